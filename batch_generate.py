@@ -0,0 +1,101 @@
+"""
+황금알을 낳는 거위: 환생 - 미로 대량 생성 (seed 코퍼스, 모든 코어 사용)
+
+사용법:
+    python batch_generate.py --seeds 0:100000 --size 25x17 --summary corpus.csv
+    python batch_generate.py --seeds 0:1000 --size 201x201 --compact --cache-dir data/maze_cache
+"""
+
+import argparse
+import csv
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+# game 패키지가 pygame을 불러오면서 표준 출력에 찍는 안내 문구가 CSV 앞에 섞이지 않게 함
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from game.core import config
+from game.systems import items
+from game.systems import maze
+from game.systems import maze_cache
+from game.systems import player
+
+SUMMARY_FIELDS = ["seed", "width", "height", "generator", "floor_cells",
+                  "golden_eggs", "food", "merchants", "secret_rooms", "exit_reachable", "shortest_path"]
+
+def parse_seed_range(text):
+    """'시작:끝' (끝 미포함) 또는 단일 seed"""
+    if ":" in text:
+        start, end = text.split(":", 1)
+        return range(int(start), int(end))
+    return range(int(text), int(text) + 1)
+
+def parse_size(text):
+    """'가로x세로'"""
+    width, height = text.lower().split("x", 1)
+    return (int(width), int(height))
+
+def generate_summary(task):
+    """미로 하나 생성 후 요약 행 반환 (워커 프로세스에서 실행)"""
+    seed, width, height, generator, compact, cache_dir = task
+    
+    stats = player.GameStats()
+    stats.random_seed = seed
+    cache = maze_cache.MazeCache(cache_dir) if cache_dir else None
+    m = maze.Maze(width, height, compact=compact, generator=generator, cache=cache)
+    m.generate(stats)
+    
+    if m.cells is not None:
+        floor_cells = m.cells.count(1)
+    else:
+        floor_cells = sum(sum(row) for row in m.grid)
+    golden_eggs = sum(1 for item in m.items_list if isinstance(item, items.GoldenEgg))
+    food = sum(1 for item in m.items_list if isinstance(item, items.Food))
+    
+    return (seed, width, height, generator, floor_cells, golden_eggs, food,
+            len(m.merchants), len(m.secret_rooms), int(m.exit_reachable), m.distance_to_exit(*m.start_pos))
+
+def iter_tasks(seed_ranges, sizes, generator, compact, cache_dir):
+    """(seed, 크기) 조합 작업 목록"""
+    for width, height in sizes:
+        for seeds in seed_ranges:
+            for seed in seeds:
+                yield (seed, width, height, generator, compact, cache_dir)
+
+def main():
+    parser = argparse.ArgumentParser(description="미로 대량 생성 (ProcessPoolExecutor)")
+    parser.add_argument("--seeds", type=parse_seed_range, nargs="+", required=True,
+                        help="seed 범위 (예: 0:100000 또는 42)")
+    parser.add_argument("--size", type=parse_size, nargs="+",
+                        default=[(config.MAZE_WIDTH_NORMAL, config.MAZE_HEIGHT_NORMAL)],
+                        help="미로 크기 (예: 25x17 201x201)")
+    parser.add_argument("--generator", default=config.MAZE_GENERATOR, choices=sorted(maze.Maze.GENERATORS))
+    parser.add_argument("--compact", action="store_true", help="압축 그리드 모드")
+    parser.add_argument("--cache-dir", default=None, help="디스크 캐시 포맷으로 저장할 디렉터리")
+    parser.add_argument("--summary", default="-", help="요약 CSV 경로 (기본: 표준 출력)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="워커 프로세스 수")
+    parser.add_argument("--chunksize", type=int, default=64, help="워커에 한 번에 넘길 작업 수")
+    args = parser.parse_args()
+    
+    tasks = iter_tasks(args.seeds, args.size, args.generator, args.compact, args.cache_dir)
+    
+    out = sys.stdout if args.summary == "-" else open(args.summary, "w", newline="", encoding="utf-8")
+    try:
+        writer = csv.writer(out)
+        writer.writerow(SUMMARY_FIELDS)
+        
+        count = 0
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            # 결과가 나오는 대로 순서대로 기록
+            for row in executor.map(generate_summary, tasks, chunksize=args.chunksize):
+                writer.writerow(row)
+                count += 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    
+    print(f"미로 {count}개 생성 완료", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
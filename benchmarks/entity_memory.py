@@ -0,0 +1,121 @@
+"""
+엔티티 메모리 벤치마크 - 클래스별 인스턴스당 바이트 (__slots__ 적용 전 baseline 정의 대비)
+
+사용법: python -m benchmarks.entity_memory [--counts 10000 100000]
+"""
+
+import argparse
+import random
+import tracemalloc
+from game.core import config
+from game.systems import effects
+from game.systems import items
+from game.systems import maze
+from game.systems import merchant
+
+# __slots__ 적용 전(baseline) 클래스 사본 - 속성 배치만 그대로 재현 (메서드는 메모리와 무관하므로 생략)
+class _BaselineItem:
+    """Item (적용 전)"""
+    def __init__(self, x, y, sprite_key="item_default"):
+        self.x = x
+        self.y = y
+        self.sprite_key = sprite_key
+        self.picked = False
+
+class _BaselineGoldenEgg(_BaselineItem):
+    """GoldenEgg (적용 전)"""
+    def __init__(self, x, y):
+        super().__init__(x, y, "golden_egg")
+
+class _BaselineFood(_BaselineItem):
+    """Food (적용 전, 전역 random 사용)"""
+    def __init__(self, x, y):
+        super().__init__(x, y, "food")
+
+class _BaselineSecretItem(_BaselineItem):
+    """SecretItem (적용 전)"""
+    def __init__(self, x, y):
+        super().__init__(x, y, "secret_item")
+        self.effect_applied = False
+
+class _BaselineEffect:
+    """Effect (적용 전, 중첩 없음)"""
+    def __init__(self, effect_type, duration, value):
+        self.type = effect_type
+        self.duration = duration
+        self.value = value
+        self.active = True
+        self.time_remaining = duration
+
+class _BaselineSpeedUp(_BaselineEffect):
+    """SpeedUp (적용 전)"""
+    def __init__(self, duration=config.EFFECT_SPEED_UP_DURATION, value=config.EFFECT_SPEED_UP_VALUE):
+        super().__init__("speed_up", duration, value)
+
+class _BaselineRouletteSlot:
+    """RouletteSlot (적용 전)"""
+    def __init__(self, effect_type, weight):
+        self.effect_type = effect_type
+        self.weight = weight
+        self.effect_class = None
+
+class _BaselineSecretRoom:
+    """SecretRoom (적용 전)"""
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.items = []
+        self.found = False
+
+class _BaselineMerchant:
+    """Merchant (적용 전, 상인마다 룰렛 슬롯 8개를 따로 만듦)"""
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.sprite_key = "merchant"
+        self.traded_times = 0
+        self.roulette_slots = []
+        for effect_type, weight in merchant.ROULETTE_SLOT_DEFINITIONS:
+            slot = _BaselineRouletteSlot(effect_type, weight)
+            slot.effect_class = merchant.EFFECT_CLASSES.get(effect_type)
+            self.roulette_slots.append(slot)
+
+# (이름, 적용 전 생성 함수, 현재 생성 함수) - 생성 함수는 번호를 받아 인스턴스 하나를 만듦
+_SHARED_RNG = random.Random(0)
+ENTITIES = [
+    ("GoldenEgg", lambda i: _BaselineGoldenEgg(i, i), lambda i: items.GoldenEgg(i, i)),
+    ("Food", lambda i: _BaselineFood(i, i), lambda i: items.Food(i, i, _SHARED_RNG)),
+    ("SecretItem", lambda i: _BaselineSecretItem(i, i), lambda i: items.SecretItem(i, i)),
+    # 효과 중첩(stacks/expiry_times) 슬롯이 늘어 적용 전보다 커짐
+    ("SpeedUp", lambda i: _BaselineSpeedUp(), lambda i: effects.SpeedUp()),
+    ("RouletteSlot", lambda i: _BaselineRouletteSlot("speed_up", 2.0), lambda i: merchant.RouletteSlot("speed_up", 2.0)),
+    ("SecretRoom", lambda i: _BaselineSecretRoom(i, i), lambda i: maze.SecretRoom(i, i)),
+    # 적용 전 상인은 룰렛 슬롯 8개 + 리스트를 인스턴스마다 보유 (지금은 공유 테이블)
+    ("Merchant", lambda i: _BaselineMerchant(i, i), lambda i: merchant.Merchant(i, i, _SHARED_RNG)),
+]
+
+def _bytes_per_entity(factory, count):
+    """count개 생성 시 인스턴스당 할당 바이트 (인스턴스가 따로 만드는 하위 객체 포함)"""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    entities = [factory(i) for i in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del entities
+    return (after - before) / count
+
+def main():
+    parser = argparse.ArgumentParser(description="엔티티 메모리 벤치마크")
+    parser.add_argument("--counts", type=int, nargs="+", default=[10000, 100000])
+    args = parser.parse_args()
+    
+    print(f"{'엔티티':<14}{'개수':>9}{'적용 전(B)':>12}{'현재(B)':>10}{'절감률':>9}")
+    for name, baseline_factory, current_factory in ENTITIES:
+        for count in args.counts:
+            baseline = _bytes_per_entity(baseline_factory, count)
+            current = _bytes_per_entity(current_factory, count)
+            print(f"{name:<14}{count:>9}{baseline:>12.1f}{current:>10.1f}"
+                  f"{1 - current / baseline:>9.1%}")
+
+if __name__ == "__main__":
+    main()
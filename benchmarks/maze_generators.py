@@ -0,0 +1,65 @@
+"""
+미로 생성 알고리즘 벤치마크 - 크기별 생성 시간과 최대 메모리 (DFS 대비)
+
+사용법: python -m benchmarks.maze_generators [--sizes 51 201 801] [--compact]
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+from game.systems import generators
+from game.systems import maze
+
+class _GridOnlyMaze(maze.Maze):
+    """오브젝트 배치 없이 그리드만 만드는 미로 (알고리즘 자체만 측정)"""
+    def generate_grid(self):
+        if self.compact:
+            self.cells = bytearray(self.width * self.height)
+            view = memoryview(self.cells)
+            self.grid = [view[y * self.width:(y + 1) * self.width] for y in range(self.height)]
+        else:
+            self.grid = [[0 for _ in range(self.width)] for _ in range(self.height)]
+        self.GENERATORS[self.generator](self, random.Random(0))
+
+def _run_grid(name, size, compact):
+    """그리드 전체를 메모리에 만드는 생성"""
+    m = _GridOnlyMaze(size, size, compact=compact, generator=name)
+    m.generate_grid()
+
+def _run_eller_stream(size):
+    """Eller 행 스트림만 소비 (그리드 미보관)"""
+    rng = random.Random(0)
+    for _ in generators.iter_eller_rows(size, size, rng):
+        pass
+
+def _measure(func, *args):
+    """(초, 최대 메모리 바이트) 측정 - 시간과 메모리는 따로 실행"""
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+    
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+def main():
+    parser = argparse.ArgumentParser(description="미로 생성 알고리즘 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[51, 201, 801])
+    parser.add_argument("--compact", action="store_true", help="압축 그리드 모드로 측정")
+    args = parser.parse_args()
+    
+    print(f"{'알고리즘':<16}{'크기':>8}{'시간(s)':>10}{'최대 메모리(KB)':>18}{'DFS 대비 시간':>14}{'DFS 대비 메모리':>16}")
+    for size in args.sizes:
+        baseline = _measure(_run_grid, "dfs", size, args.compact)
+        cases = [(name, _measure(_run_grid, name, size, args.compact)) for name in sorted(maze.Maze.GENERATORS)]
+        cases.append(("eller (stream)", _measure(_run_eller_stream, size)))
+        
+        for name, (elapsed, peak) in cases:
+            print(f"{name:<16}{size:>8}{elapsed:>10.3f}{peak / 1024:>18.1f}"
+                  f"{elapsed / baseline[0]:>14.2f}{peak / baseline[1]:>16.2f}")
+
+if __name__ == "__main__":
+    main()
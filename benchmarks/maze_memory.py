@@ -0,0 +1,49 @@
+"""
+미로 메모리 벤치마크 - 리스트/압축 그리드 모드의 그리드 크기와 전체 생성 메모리
+
+사용법: python -m benchmarks.maze_memory [--sizes 201 501 1001]
+"""
+
+import argparse
+import sys
+import tracemalloc
+from game.systems import maze
+from game.systems import player
+
+def _grid_bytes(m):
+    """그리드 저장 공간 (리스트 모드는 행 리스트 + 정수 포인터, 압축 모드는 bytearray + 행 뷰)"""
+    total = sys.getsizeof(m.grid)
+    if m.cells is not None:
+        total += sys.getsizeof(m.cells)
+    total += sum(sys.getsizeof(row) for row in m.grid)
+    return total
+
+def _measure(size, compact):
+    """(그리드 바이트, 생성 후 메모리, 최대 메모리) 측정"""
+    stats = player.GameStats()
+    stats.random_seed = 0
+    tracemalloc.start()
+    m = maze.Maze(size, size, compact=compact, cache=None)
+    m.generate(stats)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return _grid_bytes(m), current, peak
+
+def main():
+    parser = argparse.ArgumentParser(description="미로 메모리 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[201, 501])
+    args = parser.parse_args()
+    
+    print(f"{'크기':>6}{'모드':>9}{'그리드(KB)':>12}{'생성 후(KB)':>13}{'최대(KB)':>11}")
+    for size in args.sizes:
+        results = {}
+        for compact in (False, True):
+            results[compact] = _measure(size, compact)
+            grid, current, peak = results[compact]
+            mode = "compact" if compact else "list"
+            print(f"{size:>6}{mode:>9}{grid / 1024:>12.1f}{current / 1024:>13.1f}{peak / 1024:>11.1f}")
+        ratios = [l / c for l, c in zip(results[False], results[True])]
+        print(f"{'':>6}{'list/압축':>9}{ratios[0]:>11.1f}x{ratios[1]:>12.1f}x{ratios[2]:>10.1f}x")
+
+if __name__ == "__main__":
+    main()
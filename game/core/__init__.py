@@ -4,3 +4,4 @@
 
 from game.core.config import *
 from game.core.resources import ResourceManager
+from game.core.rng import derive_rng
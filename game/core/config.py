@@ -7,6 +7,24 @@ SCREEN_WIDTH = 960
 SCREEN_HEIGHT = 640
 TILE_SIZE = 32
 
+# 텍스트 Surface 캐시 최대 개수 (LRU)
+TEXT_CACHE_SIZE = 256
+
+# 스프라이트 아틀라스
+ATLAS_IMAGE_DIR = "assets/images"
+ATLAS_MAX_WIDTH = 1024  # 아틀라스 최대 너비 (픽셀)
+
+# 게임 루프 (고정 시간 간격 시뮬레이션)
+FIXED_TIMESTEP = True  # False면 프레임 dt를 그대로 사용
+SIMULATION_TICK_RATE = 60  # 초당 시뮬레이션 틱 수
+SIMULATION_SPEED = 1.0  # 실제 시간 대비 시뮬레이션 배속
+MAX_CATCHUP_STEPS = 5  # 프레임당 최대 틱 수 (초과분은 버림)
+FPS_CAP = 60  # 렌더링 프레임 제한 (0이면 제한 없음)
+
+# 정적 씬(메뉴/인트로/엔딩) 렌더링
+DIRTY_RECT_RENDERING = True  # 변경된 영역만 화면에 반영하고 변경 없으면 그리지 않음
+IDLE_FPS_CAP = 30  # 정적 씬에 변경이 없을 때의 루프 빈도
+
 # 난이도 모드
 DIFFICULTY_EASY = "easy"
 DIFFICULTY_NORMAL = "normal"
@@ -23,6 +41,28 @@ MAZE_HEIGHT_NORMAL = 17
 TUTORIAL_MAZE_WIDTH = 10
 TUTORIAL_MAZE_HEIGHT = 10
 
+# 미로 생성 알고리즘 ("dfs", "eller", "kruskal")
+MAZE_GENERATOR = "dfs"
+MAZE_GENERATOR_VERSION = 2  # 생성/배치 코드가 바뀌면 올림 (배치 밀도 설정 변경은 캐시 키에 자동 반영)
+
+# 미로 디스크 캐시 (같은 seed/크기 재생성 생략)
+MAZE_CACHE_ENABLED = False
+MAZE_CACHE_DIR = "data/maze_cache"
+
+# 무한 모드 (청크 단위 지연 생성)
+ENDLESS_CHUNK_TILES = 16  # 짝수 (셀 좌표가 청크 경계를 넘어도 홀수로 유지)
+ENDLESS_MAX_CHUNKS = 49  # 메모리에 유지할 최대 청크 수 (LRU)
+ENDLESS_MAX_CHUNK_SURFACES = 25  # 렌더링된 청크 Surface 최대 수 (LRU)
+ENDLESS_PREFETCH_RADIUS = 2  # 플레이어 주변 미리 생성할 청크 반경
+ENDLESS_CHUNKS_PER_FRAME = 1  # 프레임당 최대 생성 청크 수
+ENDLESS_MAX_CHUNK_STATES = 1024  # 획득/거래 기록을 보관할 최대 청크 수 (LRU, 초과분은 초기화)
+
+# 대형 미로용 압축 그리드 (bytearray + 방문 비트맵, 배치 난수 일괄 추출)
+MAZE_COMPACT_GRID = False
+
+# 정적 타일 레이어 청크 크기 (타일 단위)
+MAZE_CHUNK_TILES = 16
+
 # 배고픔 수치
 BASE_MAX_HUNGER = 100
 BASE_HUNGER_RATE = 3.0  # 초당 감소량
@@ -30,6 +70,22 @@ BASE_HUNGER_RATE = 3.0  # 초당 감소량
 # 이동 속도 및 시야
 BASE_SPEED = 150  # 픽셀/초
 BASE_VISION_RADIUS = 4  # 타일 단위
+VISION_LINE_OF_SIGHT = False  # 벽에 가려진 타일 숨김 (섀도캐스팅)
+
+# 전장의 안개 (한 번 본 타일을 어둡게 표시)
+FOG_OF_WAR_ENABLED = True
+FOG_COLOR = (10, 10, 20)
+FOG_EXPLORED_ALPHA = 170  # 탐험했지만 시야 밖인 타일의 어둡기 (0~255)
+
+# 미니맵 (탐험한 타일만 표시)
+MINIMAP_ENABLED = True
+MINIMAP_SIZE = 160  # 화면에 표시되는 최대 크기 (픽셀)
+MINIMAP_MAX_TILE_PIXELS = 6  # 타일당 최대 픽셀 수
+MINIMAP_UNEXPLORED_COLOR = (15, 15, 25)
+MINIMAP_WALL_COLOR = (70, 70, 90)
+MINIMAP_FLOOR_COLOR = (170, 170, 150)
+MINIMAP_MERCHANT_COLOR = (255, 200, 0)
+MINIMAP_PLAYER_COLOR = (0, 220, 255)
 
 # 욕심 디버프 임계값
 EGG_SPEED_THRESHOLD1 = 10  # 첫 번째 속도 감소 임계값
@@ -46,11 +102,17 @@ ITEM_DENSITY = 0.05  # 타일당 아이템 확률
 MERCHANT_DENSITY = 0.01  # 타일당 상인 확률
 SECRET_ROOM_CHANCE = 0.12  # 비밀 방 생성 확률
 
+# 상인/비밀 방 공간 인덱스 버킷 크기 (타일 단위, 상호작용 반경 이상)
+SPATIAL_CELL_TILES = 4
+MERCHANT_INTERACT_RADIUS = 1
+
 # 상점/룰렛 파라미터
 ROULETTE_EGG_COST = 3
 SAFE_TRADE_EGG_COST = 1
 ROULETTE_SPIN_TIME = 2.5  # 초
 ROULETTE_SLOTS_MIN = 8  # 최소 룰렛 칸 수
+ROULETTE_WHEEL_RADIUS = 120  # 룰렛 원판 반지름 (픽셀)
+ROULETTE_ROTATION_STEP = 6  # 회전 프레임 캐시 각도 간격 (도)
 
 # 룰렛 weight 조정 계수
 ROULETTE_WEIGHT_DECAY_RATE = 0.1  # 거래 횟수당 좋은 효과 weight 감소율
@@ -67,6 +129,10 @@ SAFE_TRADE_HUNGER_INSTANT_UP_CHANCE = 0.1
 SCORE_EGG_VALUE = 10
 SCORE_TIME_BONUS = 1  # 초당 보너스
 SCORE_SECRET_ROOM_BONUS = 50
+SCORE_EFFICIENCY_BONUS = 0  # 최단 경로 대비 이동 효율 보너스 최대값 (0이면 사용 안 함)
+
+# 출구 방향 힌트 표시
+EXIT_HINT_ENABLED = False
 
 # 랭크 임계값
 RANK_S_THRESHOLD = 300
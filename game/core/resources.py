@@ -4,14 +4,51 @@ ResourceManager - 이미지/사운드/폰트 키 기반 관리
 
 import pygame
 import os
+from collections import OrderedDict
 from game.core import config
 
+# 아틀라스에 항상 넣는 스프라이트 키 (이미지 파일이 없으면 폴백 타일로 채움)
+SPRITE_KEYS = ("wall", "floor", "player", "merchant", "golden_egg", "food", "secret_item", "item_default")
+FALLBACK_KEY = "fallback"
+FALLBACK_COLOR = (128, 128, 128)  # 회색
+
+def pack_shelves(sizes, max_width, padding=1):
+    """(너비, 높이) 목록을 선반 방식으로 배치 -> (위치 목록, 전체 너비, 전체 높이)"""
+    positions = [None] * len(sizes)
+    # 높은 것부터 한 줄씩 채우면 선반 높이 낭비가 적음
+    order = sorted(range(len(sizes)), key=lambda i: sizes[i][1], reverse=True)
+    x = y = shelf_height = used_width = 0
+    for i in order:
+        width, height = sizes[i]
+        if x > 0 and x + width > max_width:
+            y += shelf_height + padding
+            x = shelf_height = 0
+        positions[i] = (x, y)
+        x += width + padding
+        used_width = max(used_width, x - padding)
+        shelf_height = max(shelf_height, height)
+    return positions, used_width, y + shelf_height
+
 class ResourceManager:
     def __init__(self):
         self.images = {}
         self.sounds = {}
         self.fonts = {}
         
+        # 렌더링된 텍스트 Surface LRU 캐시
+        self.text_cache = OrderedDict()  # (폰트 키, 텍스트, 색상, 안티앨리어싱) -> Surface
+        self.text_cache_size = config.TEXT_CACHE_SIZE
+        self.text_cache_hits = 0
+        self.text_cache_misses = 0
+        
+        # 단색 오버레이/패널 Surface 풀 ((너비, 높이, 색상) -> Surface)
+        self.overlays = {}
+        
+        # 스프라이트 아틀라스 (모든 스프라이트를 담은 Surface 하나 + 키별 영역)
+        self.atlas = None
+        self.atlas_rects = {}
+        self.fallback_image = None  # 없는 키는 모두 이 Surface 공유
+        
     def load_image(self, key, path):
         """이미지 로딩"""
         try:
@@ -20,28 +57,89 @@ class ResourceManager:
                 self.images[key] = image
                 return image
             else:
-                # 폴백: 단색 Surface 생성
-                fallback = pygame.Surface((config.TILE_SIZE, config.TILE_SIZE))
-                fallback.fill((128, 128, 128))  # 회색
+                # 폴백: 공용 단색 Surface
+                fallback = self._get_fallback_image()
                 self.images[key] = fallback
                 return fallback
         except Exception as e:
             print(f"이미지 로딩 실패 {path}: {e}")
-            # 폴백 생성
-            fallback = pygame.Surface((config.TILE_SIZE, config.TILE_SIZE))
-            fallback.fill((128, 128, 128))
+            # 폴백 사용
+            fallback = self._get_fallback_image()
             self.images[key] = fallback
             return fallback
     
+    def _get_fallback_image(self):
+        """공용 폴백 Surface (처음 한 번만 생성)"""
+        if self.fallback_image is None:
+            fallback = pygame.Surface((config.TILE_SIZE, config.TILE_SIZE))
+            fallback.fill(FALLBACK_COLOR)
+            self.fallback_image = fallback
+        return self.fallback_image
+    
     def get_image(self, key):
-        """이미지 가져오기"""
-        if key in self.images:
-            return self.images[key]
-        # 기본 폴백
+        """이미지 가져오기 (없는 키는 공용 폴백, 새로 만들지 않음)"""
+        image = self.images.get(key)
+        if image is not None:
+            return image
+        return self._get_fallback_image()
+    
+    def build_atlas(self, image_dir=config.ATLAS_IMAGE_DIR, keys=SPRITE_KEYS):
+        """image_dir의 이미지와 폴백 타일을 Surface 하나로 묶고 키별 영역 등록"""
+        sources = {}
+        if os.path.isdir(image_dir):
+            for filename in sorted(os.listdir(image_dir)):
+                key, ext = os.path.splitext(filename)
+                if ext.lower() not in (".png", ".jpg", ".jpeg", ".bmp", ".gif"):
+                    continue
+                path = os.path.join(image_dir, filename)
+                try:
+                    sources[key] = pygame.image.load(path)
+                except Exception as e:
+                    print(f"이미지 로딩 실패 {path}: {e}")
+        
+        # 이미지가 없는 키는 폴백 영역 하나를 같이 씀
         fallback = pygame.Surface((config.TILE_SIZE, config.TILE_SIZE))
-        fallback.fill((128, 128, 128))
-        self.images[key] = fallback
-        return fallback
+        fallback.fill(FALLBACK_COLOR)
+        sources[FALLBACK_KEY] = fallback
+        
+        names = list(sources)
+        positions, width, height = pack_shelves([sources[name].get_size() for name in names],
+                                                config.ATLAS_MAX_WIDTH)
+        atlas = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+        atlas.fill((0, 0, 0, 0))
+        atlas.blits([(sources[name], pos) for name, pos in zip(names, positions)], doreturn=False)
+        
+        self.atlas = atlas
+        self.atlas_rects = {}
+        for name, pos in zip(names, positions):
+            self.atlas_rects[name] = pygame.Rect(pos, sources[name].get_size())
+        for key in keys:
+            self.atlas_rects.setdefault(key, self.atlas_rects[FALLBACK_KEY])
+        
+        # get_image도 아틀라스 영역을 보는 subsurface 반환 (같은 영역은 같은 Surface 공유)
+        subsurfaces = {}
+        for name, rect in self.atlas_rects.items():
+            rect_key = tuple(rect)
+            if rect_key not in subsurfaces:
+                subsurfaces[rect_key] = atlas.subsurface(rect)
+            self.images[name] = subsurfaces[rect_key]
+        self.fallback_image = self.images[FALLBACK_KEY]
+        return atlas
+    
+    def get_atlas(self):
+        """아틀라스 Surface (아직 없으면 생성)"""
+        if self.atlas is None:
+            self.build_atlas()
+        return self.atlas
+    
+    def get_sprite_rect(self, key):
+        """아틀라스 안의 스프라이트 영역 (없는 키는 폴백 영역)"""
+        if self.atlas is None:
+            self.build_atlas()
+        rect = self.atlas_rects.get(key)
+        if rect is None:
+            rect = self.atlas_rects[FALLBACK_KEY]
+        return rect
     
     def load_sound(self, key, path):
         """사운드 로딩"""
@@ -99,6 +197,33 @@ class ResourceManager:
         self.fonts[key] = font
         return font
     
+    def render_text(self, font_key, text, color, antialias=True):
+        """텍스트 Surface 가져오기 (같은 폰트/텍스트/색상은 캐시 재사용)"""
+        key = (font_key, text, color, antialias)
+        surface = self.text_cache.get(key)
+        if surface is not None:
+            self.text_cache.move_to_end(key)
+            self.text_cache_hits += 1
+            return surface
+        
+        self.text_cache_misses += 1
+        surface = self.get_font(font_key).render(text, antialias, color)
+        self.text_cache[key] = surface
+        if len(self.text_cache) > self.text_cache_size:
+            self.text_cache.popitem(last=False)
+        return surface
+    
+    def get_overlay(self, width, height, color, alpha):
+        """단색 반투명 Surface 가져오기 (크기/색상별로 한 번만 만들고 알파만 변경)"""
+        key = (width, height, color)
+        overlay = self.overlays.get(key)
+        if overlay is None:
+            overlay = pygame.Surface((width, height)).convert()
+            overlay.fill(color)
+            self.overlays[key] = overlay
+        overlay.set_alpha(alpha)
+        return overlay
+    
     def initialize_defaults(self):
         """기본 리소스 초기화"""
         # 폰트 로딩 (사용자가 제공할 예정)
@@ -108,6 +233,6 @@ class ResourceManager:
         self.load_font("main_large", font_path, 32)
         self.load_font("main_title", font_path, 48)
         
-        # 기본 이미지 (향후 assets/images/에 추가될 예정)
-        # 지금은 폴백만 사용
+        # 스프라이트 아틀라스 (assets/images/ + 폴백 타일)
+        self.build_atlas()
 
@@ -0,0 +1,23 @@
+"""
+난수 스트림 - 실행 seed에서 용도별 독립 random.Random 파생
+"""
+
+import random
+
+# 스트림 이름
+STREAM_MAZE_LAYOUT = "maze_layout"
+STREAM_ITEM_PLACEMENT = "item_placement"
+STREAM_ROULETTE = "roulette"
+STREAM_FOOD_HEAL = "food_heal"
+STREAM_SCENE = "scene"
+
+def derive_rng(seed, stream, *keys):
+    """seed + 스트림 이름(+ 추가 키)으로 독립된 난수 생성기 생성
+
+    문자열 seed는 해시 랜덤화와 무관하게 항상 같은 상태를 만든다.
+    """
+    return random.Random(":".join(str(part) for part in (seed, stream) + keys))
+
+def new_run_seed():
+    """새 실행 seed 생성"""
+    return random.randint(0, 2**31 - 1)
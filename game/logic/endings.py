@@ -92,6 +92,12 @@ class EndingManager:
             time_bonus = int((time_limit - stats.time_elapsed) * config.SCORE_TIME_BONUS)
             score += max(0, time_bonus)
         
+        # 이동 효율 보너스 (최단 경로 / 실제 이동 타일 수)
+        if (config.SCORE_EFFICIENCY_BONUS > 0 and not stats.died_by_hunger and
+                stats.shortest_path_length and stats.tiles_walked > 0):
+            efficiency = min(1.0, stats.shortest_path_length / stats.tiles_walked)
+            score += int(config.SCORE_EFFICIENCY_BONUS * efficiency)
+        
         return score
     
     def calculate_rank(self, score):
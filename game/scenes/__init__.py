@@ -2,4 +2,4 @@
 씬 모듈
 """
 
-from game.scenes.scenes import Scene, TitleScene, IntroScene, TutorialScene, MazeScene, EndingScene, ChallengeSelectScene, RecordsScene
+from game.scenes.scenes import Scene, TitleScene, IntroScene, TutorialScene, MazeScene, EndlessScene, EndingScene, ChallengeSelectScene, RecordsScene
@@ -3,29 +3,58 @@
 """
 
 import pygame
-import random
 from game.core import config
+from game.core import rng
 from game.systems import player
 from game.systems import maze
+from game.systems import endless
 from game.systems import camera
 from game.ui import ui
+from game.ui import maze_layer
+from game.ui import fog_layer
+from game.ui import minimap
 from game.logic import endings
 from game.logic import achievements
 from game.systems import merchant
 from game.systems import items
+from game.systems import vision
+from game.systems import timers
 
 class Scene:
     """씬 베이스 클래스"""
+    static = False  # True면 상태가 바뀐 프레임에만 그리고 바뀐 영역만 화면에 반영
+    
     def __init__(self, game):
         self.game = game
         self.resources = game.resources
+        self.needs_redraw = True
+        self.dirty_rects = None  # 화면에 반영할 영역 (None이면 전체 화면)
+    
+    def mark_dirty(self, rect=None):
+        """다음 프레임에 다시 그리기 예약 (rect가 None이면 전체 화면 반영)"""
+        self.needs_redraw = True
+        if rect is None:
+            self.dirty_rects = None
+        elif self.dirty_rects is not None:
+            self.dirty_rects.append(pygame.Rect(rect))
+    
+    def take_dirty_rects(self):
+        """이번 프레임에 반영할 영역 꺼내기 (None이면 전체, 빈 리스트면 변경 없음)"""
+        if not self.static:
+            return None
+        if not self.needs_redraw:
+            return []
+        rects = self.dirty_rects
+        self.needs_redraw = False
+        self.dirty_rects = []
+        return rects
     
     def update(self, dt):
         """씬 업데이트"""
         pass
     
-    def render(self, screen):
-        """씬 렌더링"""
+    def render(self, screen, alpha=1.0):
+        """씬 렌더링 (alpha: 직전 틱과 현재 틱 사이 보간 비율)"""
         pass
     
     def handle_event(self, event):
@@ -34,11 +63,15 @@ class Scene:
 
 class TitleScene(Scene):
     """타이틀 씬"""
+    static = True
+    
     def __init__(self, game):
         super().__init__(game)
         self.selected_index = 0
+        self.menu_rect = None
         self.menu_items = [
             "일반 모드",
+            "무한 모드",
             "도전 모드",
             "기록/도전과제",
             "설정",
@@ -49,41 +82,52 @@ class TitleScene(Scene):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_UP:
                 self.selected_index = (self.selected_index - 1) % len(self.menu_items)
+                self.mark_dirty(self.menu_rect)
             elif event.key == pygame.K_DOWN:
                 self.selected_index = (self.selected_index + 1) % len(self.menu_items)
+                self.mark_dirty(self.menu_rect)
             elif event.key in [pygame.K_RETURN, pygame.K_SPACE]:
                 if self.selected_index == 0:  # 일반 모드
                     self.game.stats = player.GameStats()
                     self.game.stats.difficulty = config.DIFFICULTY_NORMAL
                     self.game.stats.mode = "normal"
                     self.game.change_scene(IntroScene(self.game))
-                elif self.selected_index == 1:  # 도전 모드
+                elif self.selected_index == 1:  # 무한 모드
+                    self.game.stats = player.GameStats()
+                    self.game.stats.difficulty = config.DIFFICULTY_NORMAL
+                    self.game.stats.mode = "endless"
+                    self.game.change_scene(IntroScene(self.game))
+                elif self.selected_index == 2:  # 도전 모드
                     self.game.change_scene(ChallengeSelectScene(self.game))
-                elif self.selected_index == 2:  # 기록/도전과제
+                elif self.selected_index == 3:  # 기록/도전과제
                     self.game.change_scene(RecordsScene(self.game))
-                elif self.selected_index == 3:  # 설정
+                elif self.selected_index == 4:  # 설정
                     pass  # TODO: 설정 씬
-                elif self.selected_index == 4:  # 종료
+                elif self.selected_index == 5:  # 종료
                     self.game.running = False
     
-    def render(self, screen):
+    def render(self, screen, alpha=1.0):
         screen.fill((20, 20, 40))
         
         # 제목
-        font_title = self.resources.get_font("main_title")
-        title = font_title.render("황금알을 낳는 거위: 환생", True, (255, 215, 0))
+        title = self.resources.render_text("main_title", "황금알을 낳는 거위: 환생", (255, 215, 0))
         title_rect = title.get_rect(center=(config.SCREEN_WIDTH // 2, 150))
         screen.blit(title, title_rect)
         
-        # 메뉴
-        ui.UI.draw_menu(screen, self.resources, self.menu_items, self.selected_index,
-                       config.SCREEN_WIDTH // 2 - 100, 300)
+        # 메뉴 (이전/현재 선택 항목 폭이 달라도 둘 다 반영)
+        self.menu_rect = ui.UI.draw_menu(screen, self.resources, self.menu_items, self.selected_index,
+                                         config.SCREEN_WIDTH // 2 - 100, 300)
+        self.mark_dirty(self.menu_rect)
 
 class ChallengeSelectScene(Scene):
     """도전 모드 선택 씬"""
+    static = True
+    
     def __init__(self, game):
         super().__init__(game)
         self.selected_index = 0
+        self.menu_rect = None
+        self.desc_rect = None
         self.challenges = [
             ("무욕의 길", config.CHALLENGE_NO_GREED, "황금알을 하나라도 획득하면 실패합니다."),
             ("대부호의 야망", config.CHALLENGE_GREED_OVERDRIVE, "7분 안에 황금알 20개 이상 수집 후 탈출하세요."),
@@ -96,8 +140,10 @@ class ChallengeSelectScene(Scene):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_UP:
                 self.selected_index = (self.selected_index - 1) % len(self.menu_items)
+                self._mark_selection_dirty()
             elif event.key == pygame.K_DOWN:
                 self.selected_index = (self.selected_index + 1) % len(self.menu_items)
+                self._mark_selection_dirty()
             elif event.key in [pygame.K_RETURN, pygame.K_SPACE]:
                 if self.selected_index < len(self.challenges):
                     # 도전 모드 선택
@@ -111,27 +157,36 @@ class ChallengeSelectScene(Scene):
             elif event.key == pygame.K_ESCAPE:
                 self.game.change_scene(TitleScene(self.game))
     
-    def render(self, screen):
+    def _mark_selection_dirty(self):
+        """선택 변경 시 직전에 그린 메뉴/설명 영역 갱신 예약"""
+        self.mark_dirty(self.menu_rect)
+        if self.desc_rect is not None:
+            self.mark_dirty(self.desc_rect)
+    
+    def render(self, screen, alpha=1.0):
         screen.fill((20, 20, 40))
         
-        font_title = self.resources.get_font("main_large")
-        title = font_title.render("도전 모드", True, (255, 255, 255))
+        title = self.resources.render_text("main_large", "도전 모드", (255, 255, 255))
         title_rect = title.get_rect(center=(config.SCREEN_WIDTH // 2, 100))
         screen.blit(title, title_rect)
         
         # 메뉴
-        ui.UI.draw_menu(screen, self.resources, self.menu_items, self.selected_index,
-                       config.SCREEN_WIDTH // 2 - 150, 200)
+        self.menu_rect = ui.UI.draw_menu(screen, self.resources, self.menu_items, self.selected_index,
+                                         config.SCREEN_WIDTH // 2 - 150, 200)
+        self.mark_dirty(self.menu_rect)
         
         # 설명
+        self.desc_rect = None
         if self.selected_index < len(self.challenges):
-            font_small = self.resources.get_font("main_small")
-            desc = font_small.render(self.challenges[self.selected_index][2], True, (200, 200, 200))
+            desc = self.resources.render_text("main_small", self.challenges[self.selected_index][2], (200, 200, 200))
             desc_rect = desc.get_rect(center=(config.SCREEN_WIDTH // 2, 500))
-            screen.blit(desc, desc_rect)
+            self.desc_rect = screen.blit(desc, desc_rect)
+            self.mark_dirty(self.desc_rect)
 
 class RecordsScene(Scene):
     """기록/도전과제 씬"""
+    static = True
+    
     def __init__(self, game):
         super().__init__(game)
         self.achievement_manager = achievements.AchievementManager()
@@ -141,29 +196,29 @@ class RecordsScene(Scene):
             if event.key == pygame.K_ESCAPE:
                 self.game.change_scene(TitleScene(self.game))
     
-    def render(self, screen):
+    def render(self, screen, alpha=1.0):
         screen.fill((20, 20, 40))
         
-        font_title = self.resources.get_font("main_large")
-        title = font_title.render("도전과제", True, (255, 255, 255))
+        title = self.resources.render_text("main_large", "도전과제", (255, 255, 255))
         screen.blit(title, (50, 50))
         
-        font_small = self.resources.get_font("main_small")
         y = 100
         for ach_id, ach in self.achievement_manager.achievements.items():
             if not ach.hidden or ach.unlocked:
                 status = "✓" if ach.unlocked else "○"
                 color = (100, 255, 100) if ach.unlocked else (150, 150, 150)
-                text = font_small.render(f"{status} {ach.name}: {ach.description}", True, color)
+                text = self.resources.render_text("main_small", f"{status} {ach.name}: {ach.description}", color)
                 screen.blit(text, (50, y))
                 y += 30
         
         # 뒤로 가기 안내
-        back_text = font_small.render("ESC: 뒤로", True, (200, 200, 200))
+        back_text = self.resources.render_text("main_small", "ESC: 뒤로", (200, 200, 200))
         screen.blit(back_text, (50, config.SCREEN_HEIGHT - 50))
 
 class IntroScene(Scene):
     """인트로 씬 (거위와의 대화)"""
+    static = True
+    
     def __init__(self, game):
         super().__init__(game)
         self.dialogue_index = 0
@@ -182,6 +237,7 @@ class IntroScene(Scene):
             "계약을 거절한다"
         ]
         self.choice_made = False
+        self.menu_rect = None
     
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
@@ -191,12 +247,15 @@ class IntroScene(Scene):
                         self.dialogue_index += 1
                         if self.dialogue_index == len(self.dialogue_list) - 1:
                             self.show_choice = True
+                        self.mark_dirty()
             else:
                 if not self.choice_made:
                     if event.key == pygame.K_UP:
                         self.choice_index = (self.choice_index - 1) % len(self.choice_items)
+                        self.mark_dirty(self.menu_rect)
                     elif event.key == pygame.K_DOWN:
                         self.choice_index = (self.choice_index + 1) % len(self.choice_items)
+                        self.mark_dirty(self.menu_rect)
                     elif event.key in [pygame.K_RETURN, pygame.K_SPACE]:
                         self.choice_made = True
                         if self.choice_index == 0:  # 욕심
@@ -212,26 +271,24 @@ class IntroScene(Scene):
                             ending_manager.record_ending(ending_type)
                             self.game.change_scene(EndingScene(self.game, ending_type))
     
-    def render(self, screen):
+    def render(self, screen, alpha=1.0):
         screen.fill((30, 30, 50))
         
-        font_medium = self.resources.get_font("main_medium")
-        font_small = self.resources.get_font("main_small")
-        
         if not self.show_choice:
             # 대사 표시
             dialogue = self.dialogue_list[self.dialogue_index]
-            text = font_medium.render(dialogue, True, (255, 255, 255))
+            text = self.resources.render_text("main_medium", dialogue, (255, 255, 255))
             text_rect = text.get_rect(center=(config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2))
             screen.blit(text, text_rect)
             
             # 다음 안내
-            next_text = font_small.render("Space/Enter: 다음", True, (200, 200, 200))
+            next_text = self.resources.render_text("main_small", "Space/Enter: 다음", (200, 200, 200))
             screen.blit(next_text, (config.SCREEN_WIDTH // 2 - 100, config.SCREEN_HEIGHT - 100))
         else:
             # 선택지 표시
-            ui.UI.draw_menu(screen, self.resources, self.choice_items, self.choice_index,
-                           config.SCREEN_WIDTH // 2 - 150, config.SCREEN_HEIGHT // 2 - 50)
+            self.menu_rect = ui.UI.draw_menu(screen, self.resources, self.choice_items, self.choice_index,
+                                             config.SCREEN_WIDTH // 2 - 150, config.SCREEN_HEIGHT // 2 - 50)
+            self.mark_dirty(self.menu_rect)
 
 class TutorialScene(Scene):
     """튜토리얼 씬"""
@@ -239,6 +296,7 @@ class TutorialScene(Scene):
         super().__init__(game)
         self.tutorial_maze = maze.Maze(config.TUTORIAL_MAZE_WIDTH, config.TUTORIAL_MAZE_HEIGHT)
         self.tutorial_maze.generate(self.game.stats)
+        self.tutorial_layer = maze_layer.MazeLayer(self.tutorial_maze, self.resources)
         self.tutorial_player = player.Player(
             self.tutorial_maze.start_pos[0] * config.TILE_SIZE,
             self.tutorial_maze.start_pos[1] * config.TILE_SIZE,
@@ -266,13 +324,15 @@ class TutorialScene(Scene):
         if event.type == pygame.KEYDOWN:
             if event.key in [pygame.K_RETURN, pygame.K_SPACE]:
                 if self.skip_allowed:
-                    self.game.change_scene(MazeScene(self.game))
+                    self.game.change_scene(create_maze_scene(self.game))
             elif event.key == pygame.K_ESCAPE:
-                self.game.change_scene(MazeScene(self.game))
+                self.game.change_scene(create_maze_scene(self.game))
     
-    def render(self, screen):
+    def render(self, screen, alpha=1.0):
         screen.fill((10, 10, 20))
         
+        self.tutorial_camera.interpolate(alpha)
+        
         # 미로 렌더링
         self._render_maze(screen)
         
@@ -287,30 +347,18 @@ class TutorialScene(Scene):
         
         # 스킵 안내
         if self.skip_allowed:
-            font_small = self.resources.get_font("main_small")
-            skip_text = font_small.render("Space/Enter: 스킵", True, (200, 200, 200))
+            skip_text = self.resources.render_text("main_small", "Space/Enter: 스킵", (200, 200, 200))
             screen.blit(skip_text, (config.SCREEN_WIDTH - 200, config.SCREEN_HEIGHT - 50))
     
     def _render_maze(self, screen):
-        """미로 렌더링"""
-        wall_sprite = self.resources.get_image("wall")
-        floor_sprite = self.resources.get_image("floor")
-        
-        for y in range(self.tutorial_maze.height):
-            for x in range(self.tutorial_maze.width):
-                screen_x, screen_y = self.tutorial_camera.apply((x * config.TILE_SIZE, y * config.TILE_SIZE))
-                if self.tutorial_camera.is_visible((x * config.TILE_SIZE, y * config.TILE_SIZE)):
-                    if self.tutorial_maze.grid[y][x] == 0:
-                        screen.blit(wall_sprite, (screen_x, screen_y))
-                    else:
-                        screen.blit(floor_sprite, (screen_x, screen_y))
+        """미로 렌더링 (화면과 겹치는 청크만)"""
+        self.tutorial_layer.render(screen, self.tutorial_camera)
 
 class MazeScene(Scene):
     """메인 미로 씬"""
     def __init__(self, game):
         super().__init__(game)
-        self.maze = maze.Maze(config.MAZE_WIDTH_NORMAL, config.MAZE_HEIGHT_NORMAL)
-        self.maze.generate(self.game.stats)
+        self._setup_maze()
         self.game_player = player.Player(
             self.maze.start_pos[0] * config.TILE_SIZE,
             self.maze.start_pos[1] * config.TILE_SIZE,
@@ -318,20 +366,28 @@ class MazeScene(Scene):
             self.resources
         )
         self.game_camera = camera.Camera()
+        self.rng = rng.derive_rng(self.game.stats.random_seed, rng.STREAM_SCENE)
+        
+        # 최단 경로 길이 (출구 거리장에서 O(1) 조회)
+        self.game.stats.shortest_path_length = self.maze.distance_to_exit(*self.maze.start_pos)
+        self.game.stats.tiles_walked = 0
+        self.last_player_tile = self.game_player.get_tile_pos()
         
         # 상점 상태
         self.shop_state = config.SHOP_STATE_NORMAL
         self.current_merchant = None
         self.shop_menu_index = 0
         
+        # 씬 타이머 (팝업, 룰렛 회전, 사망 연출)
+        self.timers = timers.Scheduler()
+        
         # 룰렛 상태
-        self.roulette_spin_time = 0
+        self.roulette_timer = None
         self.roulette_result_effect = None
         self.roulette_current_slot = 0
         
         # 배고픔 사망 연출
-        self.death_fade_alpha = 0
-        self.death_text_time = 0
+        self.death_started_at = None
         
         # 도전 모드 체크
         self.challenge_failed = False
@@ -346,27 +402,29 @@ class MazeScene(Scene):
         
         # 팝업 메시지
         self.popup_message = None
-        self.popup_time = 0.0
+        self.popup_timer = None
+    
+    def _setup_maze(self):
+        """미로 생성 및 렌더링 레이어 준비"""
+        self.maze = maze.Maze(config.MAZE_WIDTH_NORMAL, config.MAZE_HEIGHT_NORMAL)
+        self.maze.generate(self.game.stats)
+        self.maze_layer = maze_layer.MazeLayer(self.maze, self.resources)
+        self.vision_field = vision.VisionField(self.maze)
+        self.fog_layer = fog_layer.FogLayer(self.maze) if config.FOG_OF_WAR_ENABLED else None
+        self.minimap = minimap.Minimap(self.maze) if config.MINIMAP_ENABLED else None
+        self.visible_tiles = None
     
     def update(self, dt):
-        if self.challenge_failed or not self.game_player.alive:
-            return
+        self.game_player.save_previous_position()
+        self.timers.advance(dt)
         
-        # 배고픔 사망 체크
-        if self.game_player.hunger <= 0 and self.game_player.alive:
+        # 배고픔 사망 체크 (사망 연출은 한 번만 예약)
+        if self.game_player.hunger <= 0 and self.death_started_at is None:
             self.game_player.alive = False
             self.game_player.stats.died_by_hunger = True
+            self._start_death_sequence()
         
-        # 배고픔 사망 연출
-        if self.game_player.stats.died_by_hunger:
-            self.death_fade_alpha = min(255, self.death_fade_alpha + int(255 * dt / config.DEATH_FADE_TIME))
-            if self.death_fade_alpha >= 200:
-                self.death_text_time += dt
-                if self.death_text_time >= config.DEATH_TEXT_DISPLAY_TIME + config.DEATH_FADE_TIME:
-                    ending_manager = endings.EndingManager()
-                    ending_type = ending_manager.determine_ending(self.game_player.stats)
-                    ending_manager.record_ending(ending_type)
-                    self.game.change_scene(EndingScene(self.game, ending_type))
+        if self.challenge_failed or not self.game_player.alive:
             return
         
         # 도전 모드 실패 체크
@@ -374,22 +432,26 @@ class MazeScene(Scene):
             if self.game_player.stats.challenge_id == config.CHALLENGE_NO_GREED:
                 if self.game_player.eggs > 0:
                     self.challenge_failed = True
-                    self.popup_message = "도전 실패: 황금알을 획득했습니다"
-                    self.popup_time = 3.0
+                    self._show_popup("도전 실패: 황금알을 획득했습니다", 3.0)
             elif self.game_player.stats.challenge_id == config.CHALLENGE_GREED_OVERDRIVE:
                 if self.game_player.stats.time_elapsed >= config.CHALLENGE_GREED_OVERDRIVE_TIME_LIMIT:
                     self.challenge_failed = True
-                    self.popup_message = "도전 실패: 시간 초과"
-                    self.popup_time = 3.0
+                    self._show_popup("도전 실패: 시간 초과", 3.0)
         
         # 플레이어 이동 (연속 입력)
         if self.move_dx != 0 or self.move_dy != 0:
             self.game_player.move(self.move_dx, self.move_dy, self.maze, dt)
             
+            # 이동 타일 수 집계
+            tile_pos = self.game_player.get_tile_pos()
+            if tile_pos != self.last_player_tile:
+                self.last_player_tile = tile_pos
+                self.game_player.stats.tiles_walked += 1
+            
             # 아이템 획득 체크
             item = self.maze.get_item_at(self.game_player.x, self.game_player.y)
             if item and not item.picked:
-                item.on_pick(self.game_player, self.game_player.stats)
+                self.maze.pick_item(item, self.game_player, self.game_player.stats)
             
             self.move_dx = 0
             self.move_dy = 0
@@ -407,24 +469,49 @@ class MazeScene(Scene):
         if self.game_player.hunger / self.game_player.max_hunger >= 0.9:
             self.hunger_90plus_time += dt
             self.game_player.stats.hunger_90plus_time = self.hunger_90plus_time
-        
-        # 룰렛 회전 업데이트
+    
+    def _show_popup(self, message, duration):
+        """팝업 메시지 표시 (이전 팝업 타이머는 취소)"""
+        self.timers.cancel(self.popup_timer)
+        self.popup_message = message
+        self.popup_timer = self.timers.schedule(duration, self._on_popup_expired)
+    
+    def _on_popup_expired(self):
+        """팝업 종료 (도전 실패 팝업이면 엔딩으로)"""
+        self.popup_message = None
+        self.popup_timer = None
+        if self.challenge_failed:
+            ending_manager = endings.EndingManager()
+            ending_type = endings.ENDING_HELL  # 도전 실패는 HELL
+            ending_manager.record_ending(ending_type)
+            self.game.change_scene(EndingScene(self.game, ending_type))
+    
+    def _on_roulette_spin_done(self):
+        """룰렛 회전 종료"""
+        self.roulette_timer = None
         if self.shop_state == config.SHOP_STATE_ROULETTE_SPIN:
-            self.roulette_spin_time += dt
-            if self.roulette_spin_time >= config.ROULETTE_SPIN_TIME:
-                self.shop_state = config.SHOP_STATE_ROULETTE_RESULT
-                self.roulette_spin_time = 0
-        
-        # 팝업 메시지 업데이트
-        if self.popup_message:
-            self.popup_time -= dt
-            if self.popup_time <= 0:
-                if self.challenge_failed:
-                    ending_manager = endings.EndingManager()
-                    ending_type = endings.ENDING_HELL  # 도전 실패는 HELL
-                    ending_manager.record_ending(ending_type)
-                    self.game.change_scene(EndingScene(self.game, ending_type))
-                self.popup_message = None
+            self.shop_state = config.SHOP_STATE_ROULETTE_RESULT
+    
+    def _start_death_sequence(self):
+        """사망 연출 시작 (화면이 충분히 어두워진 뒤 텍스트 표시 후 엔딩으로)"""
+        self.death_started_at = self.timers.now
+        text_start = config.DEATH_FADE_TIME * 200 / 255
+        self.timers.schedule(text_start + config.DEATH_TEXT_DISPLAY_TIME + config.DEATH_FADE_TIME,
+                             self._on_death_sequence_done)
+    
+    def _on_death_sequence_done(self):
+        """사망 연출 종료"""
+        ending_manager = endings.EndingManager()
+        ending_type = ending_manager.determine_ending(self.game_player.stats)
+        ending_manager.record_ending(ending_type)
+        self.game.change_scene(EndingScene(self.game, ending_type))
+    
+    def _death_fade_alpha(self):
+        """사망 연출 경과 시간에 따른 화면 어둡기"""
+        if self.death_started_at is None:
+            return 0
+        elapsed = self.timers.now - self.death_started_at
+        return min(255, int(255 * elapsed / config.DEATH_FADE_TIME))
     
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
@@ -467,13 +554,13 @@ class MazeScene(Scene):
                             effect, error = self.current_merchant.trade_roulette(self.game_player)
                             if effect:
                                 self.roulette_result_effect = effect
-                                self.roulette_current_slot = random.randint(0, len(self.current_merchant.roulette_slots) - 1)
+                                self.roulette_current_slot = self.rng.randint(0, len(self.current_merchant.roulette_slots) - 1)
                                 self.shop_state = config.SHOP_STATE_ROULETTE_SPIN
-                                self.roulette_spin_time = 0
+                                self.roulette_timer = self.timers.schedule(config.ROULETTE_SPIN_TIME,
+                                                                           self._on_roulette_spin_done)
                                 self.game_player.stats.trader_count += 1
                             elif error:
-                                self.popup_message = error
-                                self.popup_time = 2.0
+                                self._show_popup(error, 2.0)
                     elif self.shop_menu_index == 1:  # 안전 거래
                         if self.current_merchant:
                             effect, error = self.current_merchant.trade_safe(self.game_player)
@@ -482,8 +569,7 @@ class MazeScene(Scene):
                                 self.shop_state = config.SHOP_STATE_NORMAL
                                 self.current_merchant = None
                             elif error:
-                                self.popup_message = error
-                                self.popup_time = 2.0
+                                self._show_popup(error, 2.0)
                     elif self.shop_menu_index == 2:  # 그만두기
                         self.shop_state = config.SHOP_STATE_NORMAL
                         self.current_merchant = None
@@ -498,37 +584,53 @@ class MazeScene(Scene):
                     self.current_merchant = None
                     self.roulette_result_effect = None
     
-    def render(self, screen):
+    def render(self, screen, alpha=1.0):
         screen.fill((10, 10, 20))
         
+        self.game_camera.interpolate(alpha)
+        
         # 미로 렌더링
         self._render_maze(screen)
         
-        # 아이템 렌더링
-        for item in self.maze.items_list:
-            item.render(screen, self.game_camera, self.resources)
-        
-        # 상인 렌더링
-        for m in self.maze.merchants:
-            screen_x, screen_y = self.game_camera.apply((m.x, m.y))
-            if self.game_camera.is_visible((m.x, m.y)):
-                merchant_sprite = self.resources.get_image("merchant")
-                screen.blit(merchant_sprite, (screen_x, screen_y))
+        # 아이템 렌더링 (화면 안의 미획득 아이템만)
+        self.maze.render_items(screen, self.game_camera, self.resources)
+        
+        # 상인 렌더링 (화면 타일 범위의 상인만 공간 인덱스로 찾아 아틀라스에서 한 번에 blit)
+        left, top, right, bottom = self.game_camera.get_view_bounds()
+        # 스프라이트가 걸쳐 보이는 왼쪽/위쪽 한 타일 여유
+        on_screen = self.maze.merchant_index.query_rect(int(left // config.TILE_SIZE) - 1,
+                                                        int(top // config.TILE_SIZE) - 1,
+                                                        int(right // config.TILE_SIZE),
+                                                        int(bottom // config.TILE_SIZE))
+        atlas = self.resources.get_atlas()
+        merchant_area = self.resources.get_sprite_rect("merchant")
+        screen.blits([(atlas, self.game_camera.apply((m.x, m.y)), merchant_area) for m in on_screen],
+                     doreturn=False)
         
         # 플레이어 렌더링
-        screen_x, screen_y = self.game_camera.apply((self.game_player.x, self.game_player.y))
+        screen_x, screen_y = self.game_camera.apply(self.game_player.get_render_pos(alpha))
         player_sprite = self.resources.get_image("player")
         screen.blit(player_sprite, (screen_x, screen_y))
         
         # HUD
         ui.UI.draw_hunger_bar(screen, self.resources, self.game_player.hunger, 
                               self.game_player.max_hunger, 10, 10, 200, 30)
+        if self.minimap is not None:
+            self.minimap.render(screen, config.SCREEN_WIDTH - self.minimap.view_width - 10, 10,
+                                self.game_player.get_tile_pos())
         ui.UI.draw_eggs_count(screen, self.resources, self.game_player.eggs, 10, 50)
-        ui.UI.draw_effects_list(screen, self.resources, self.game_player.effects, 10, 80)
+        ui.UI.draw_effects_list(screen, self.resources, self.game_player.effects, 10, 80,
+                                self.game_player.timers.now)
+        
+        # 출구 방향 힌트
+        if config.EXIT_HINT_ENABLED:
+            direction = self.maze.direction_to_exit(*self.game_player.get_tile_pos())
+            if direction:
+                ui.UI.draw_exit_hint(screen, self.resources, direction, 220, 15)
         
         # 배고픔 경고
         hunger_ratio = self.game_player.hunger / self.game_player.max_hunger
-        ui.UI.draw_hunger_warning(screen, hunger_ratio)
+        ui.UI.draw_hunger_warning(screen, self.resources, hunger_ratio)
         
         # 상점 UI
         if self.shop_state == config.SHOP_STATE_MENU:
@@ -538,41 +640,39 @@ class MazeScene(Scene):
         elif self.shop_state == config.SHOP_STATE_ROULETTE_SPIN:
             if self.current_merchant:
                 ui.UI.draw_roulette(screen, self.resources, self.current_merchant.roulette_slots,
-                                   self.roulette_current_slot, self.roulette_spin_time,
+                                   self.roulette_current_slot,
+                                   config.ROULETTE_SPIN_TIME - self.timers.remaining(self.roulette_timer),
                                    config.ROULETTE_SPIN_TIME)
         elif self.shop_state == config.SHOP_STATE_ROULETTE_RESULT:
             if self.roulette_result_effect:
-                font = self.resources.get_font("main_medium")
                 effect_name = self.roulette_result_effect.type
-                text = font.render(f"결과: {effect_name}", True, (255, 255, 255))
+                text = self.resources.render_text("main_medium", f"결과: {effect_name}", (255, 255, 255))
                 text_rect = text.get_rect(center=(config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2))
                 screen.blit(text, text_rect)
         
         # 팝업 메시지
         if self.popup_message:
             ui.UI.draw_popup(screen, self.resources, self.popup_message, 3.0, 
-                           3.0 - self.popup_time)
+                           3.0 - self.timers.remaining(self.popup_timer))
         
         # 배고픔 사망 연출
         if self.game_player.stats.died_by_hunger:
-            ui.UI.draw_death_screen(screen, self.death_fade_alpha)
+            ui.UI.draw_death_screen(screen, self.resources, self._death_fade_alpha())
         
         # 출구 도달 체크
         tile_x, tile_y = self.game_player.get_tile_pos()
-        if self.maze.is_exit(tile_x, tile_y):
+        if self.maze.is_exit(tile_x, tile_y) and not self.challenge_failed:
             # 도전 모드 최종 체크
             if self.game_player.stats.mode == "challenge":
                 if self.game_player.stats.challenge_id == config.CHALLENGE_GREED_OVERDRIVE:
                     if self.game_player.eggs < config.CHALLENGE_GREED_OVERDRIVE_TARGET_EGGS:
                         self.challenge_failed = True
-                        self.popup_message = "도전 실패: 목표 개수 미달"
-                        self.popup_time = 3.0
+                        self._show_popup("도전 실패: 목표 개수 미달", 3.0)
                         return
                 elif self.game_player.stats.challenge_id == config.CHALLENGE_GAMBLER_CURSE:
                     if self.game_player.stats.trader_count < config.CHALLENGE_GAMBLER_CURSE_MIN_TRADES:
                         self.challenge_failed = True
-                        self.popup_message = "도전 실패: 상인 거래 횟수 부족"
-                        self.popup_time = 3.0
+                        self._show_popup("도전 실패: 상인 거래 횟수 부족", 3.0)
                         return
             
             # 클리어
@@ -583,26 +683,59 @@ class MazeScene(Scene):
     
     def _render_maze(self, screen):
         """미로 렌더링 (시야 제한 적용)"""
-        wall_sprite = self.resources.get_image("wall")
-        floor_sprite = self.resources.get_image("floor")
-        
         player_tile_x, player_tile_y = self.game_player.get_tile_pos()
-        vision_radius = self.game_player.vision_radius
-        
-        for y in range(self.maze.height):
-            for x in range(self.maze.width):
-                # 시야 범위 체크
-                dist = ((x - player_tile_x) ** 2 + (y - player_tile_y) ** 2) ** 0.5
-                if dist <= vision_radius:
-                    screen_x, screen_y = self.game_camera.apply((x * config.TILE_SIZE, y * config.TILE_SIZE))
-                    if self.game_camera.is_visible((x * config.TILE_SIZE, y * config.TILE_SIZE)):
-                        if self.maze.grid[y][x] == 0:
-                            screen.blit(wall_sprite, (screen_x, screen_y))
-                        else:
-                            screen.blit(floor_sprite, (screen_x, screen_y))
+        visible_tiles = self.vision_field.update(player_tile_x, player_tile_y,
+                                                 self.game_player.vision_radius)
+        
+        # 시야가 바뀐 경우에만 탐험 기록 갱신
+        if visible_tiles is not self.visible_tiles:
+            self.visible_tiles = visible_tiles
+            self._on_tiles_explored(self.maze.mark_explored(visible_tiles))
+        
+        # 전장의 안개: 전체 타일 위에 안개를 덮고 시야 타일만 밝게 다시 그림
+        if self.fog_layer is not None:
+            self.maze_layer.render(screen, self.game_camera)
+            self.fog_layer.render(screen, self.game_camera)
+        
+        self.maze_layer.render_tiles(screen, self.game_camera, visible_tiles)
+
+    def _on_tiles_explored(self, tiles):
+        """새로 탐험한 타일 반영"""
+        if self.fog_layer is not None:
+            self.fog_layer.reveal(tiles)
+        if self.minimap is not None:
+            self.minimap.reveal(tiles)
+
+class EndlessScene(MazeScene):
+    """무한 모드 씬 (청크를 카메라 주변에서만 생성/유지)"""
+    def _setup_maze(self):
+        """청크 미로 생성 및 스트리밍 레이어 준비"""
+        self.maze = endless.ChunkedMaze()
+        self.maze.generate(self.game.stats)
+        self.maze_layer = maze_layer.StreamingMazeLayer(self.maze, self.resources)
+        self.vision_field = vision.VisionField(self.maze)
+        self.fog_layer = None  # 무한 맵은 탐험 기록을 남기지 않음
+        self.minimap = None
+        self.visible_tiles = None
+    
+    def update(self, dt):
+        super().update(dt)
+        
+        # 주변 청크 미리 생성 (프레임당 제한된 개수만)
+        tile_x, tile_y = self.game_player.get_tile_pos()
+        self.maze.stream(tile_x, tile_y)
+        self.maze_layer.prefetch(self.game_camera)
+
+def create_maze_scene(game):
+    """게임 모드에 맞는 미로 씬 생성"""
+    if game.stats.mode == "endless":
+        return EndlessScene(game)
+    return MazeScene(game)
 
 class EndingScene(Scene):
     """엔딩 씬"""
+    static = True
+    
     def __init__(self, game, ending_type):
         super().__init__(game)
         self.ending_type = ending_type
@@ -624,27 +757,36 @@ class EndingScene(Scene):
         # 버튼
         self.selected_button = 0
         self.buttons = ["다시하기", "타이틀로"]
+        self.menu_rect = None
         
         # 새 도전과제 표시
         self.show_new_achievements = len(self.achievement_manager.new_achievements) > 0
-        self.achievement_display_time = 0.0
+        self.timers = timers.Scheduler()
+        self.achievement_timer = None
+        if self.show_new_achievements:
+            self.achievement_timer = self.timers.schedule(3.0, self._hide_new_achievements)
     
     def update(self, dt):
-        if self.show_new_achievements:
-            self.achievement_display_time += dt
-            if self.achievement_display_time >= 3.0:
-                self.show_new_achievements = False
+        self.timers.advance(dt)
+    
+    def _hide_new_achievements(self):
+        """새 도전과제 표시 종료"""
+        self.timers.cancel(self.achievement_timer)
+        self.show_new_achievements = False
+        self.mark_dirty()
     
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
             if self.show_new_achievements:
                 if event.key in [pygame.K_RETURN, pygame.K_SPACE, pygame.K_ESCAPE]:
-                    self.show_new_achievements = False
+                    self._hide_new_achievements()
             else:
                 if event.key == pygame.K_UP:
                     self.selected_button = 0
+                    self.mark_dirty(self.menu_rect)
                 elif event.key == pygame.K_DOWN:
                     self.selected_button = 1
+                    self.mark_dirty(self.menu_rect)
                 elif event.key in [pygame.K_RETURN, pygame.K_SPACE]:
                     if self.selected_button == 0:  # 다시하기
                         # 동일한 설정으로 재시작
@@ -657,57 +799,52 @@ class EndingScene(Scene):
                     elif self.selected_button == 1:  # 타이틀로
                         self.game.change_scene(TitleScene(self.game))
     
-    def render(self, screen):
+    def render(self, screen, alpha=1.0):
         screen.fill((20, 20, 30))
         
-        font_title = self.resources.get_font("main_large")
-        font_medium = self.resources.get_font("main_medium")
-        font_small = self.resources.get_font("main_small")
-        
         # 엔딩 제목
         ending_name = endings.ENDING_NAMES.get(self.ending_type, self.ending_type)
-        title = font_title.render(ending_name, True, (255, 215, 0))
+        title = self.resources.render_text("main_large", ending_name, (255, 215, 0))
         title_rect = title.get_rect(center=(config.SCREEN_WIDTH // 2, 100))
         screen.blit(title, title_rect)
         
         # 엔딩 설명
         ending_desc = endings.ENDING_DESCRIPTIONS.get(self.ending_type, "")
-        desc = font_medium.render(ending_desc, True, (255, 255, 255))
+        desc = self.resources.render_text("main_medium", ending_desc, (255, 255, 255))
         desc_rect = desc.get_rect(center=(config.SCREEN_WIDTH // 2, 200))
         screen.blit(desc, desc_rect)
         
         # 점수 및 랭크
-        score_text = font_medium.render(f"점수: {self.score}", True, (255, 255, 255))
+        score_text = self.resources.render_text("main_medium", f"점수: {self.score}", (255, 255, 255))
         score_rect = score_text.get_rect(center=(config.SCREEN_WIDTH // 2, 280))
         screen.blit(score_text, score_rect)
         
-        rank_text = font_title.render(f"랭크: {self.rank}", True, (255, 215, 0))
+        rank_text = self.resources.render_text("main_large", f"랭크: {self.rank}", (255, 215, 0))
         rank_rect = rank_text.get_rect(center=(config.SCREEN_WIDTH // 2, 330))
         screen.blit(rank_text, rank_rect)
         
         # 새 도전과제 표시
         if self.show_new_achievements:
-            panel = pygame.Surface((600, 200))
-            panel.set_alpha(240)
-            panel.fill((0, 50, 0))
+            panel = self.resources.get_overlay(600, 200, (0, 50, 0), 240)
             panel_x = (config.SCREEN_WIDTH - 600) // 2
             panel_y = (config.SCREEN_HEIGHT - 200) // 2
             screen.blit(panel, (panel_x, panel_y))
             
-            new_text = font_medium.render("새 도전과제 달성!", True, (100, 255, 100))
+            new_text = self.resources.render_text("main_medium", "새 도전과제 달성!", (100, 255, 100))
             new_rect = new_text.get_rect(center=(panel_x + 300, panel_y + 30))
             screen.blit(new_text, new_rect)
             
             y_offset = 70
             for ach in self.achievement_manager.new_achievements:
-                ach_text = font_small.render(f"- {ach.name}", True, (255, 255, 255))
+                ach_text = self.resources.render_text("main_small", f"- {ach.name}", (255, 255, 255))
                 screen.blit(ach_text, (panel_x + 50, panel_y + y_offset))
                 y_offset += 30
             
-            continue_text = font_small.render("Space/Enter: 계속", True, (200, 200, 200))
+            continue_text = self.resources.render_text("main_small", "Space/Enter: 계속", (200, 200, 200))
             screen.blit(continue_text, (panel_x + 200, panel_y + 160))
         else:
             # 버튼
-            ui.UI.draw_menu(screen, self.resources, self.buttons, self.selected_button,
-                           config.SCREEN_WIDTH // 2 - 100, 450)
+            self.menu_rect = ui.UI.draw_menu(screen, self.resources, self.buttons, self.selected_button,
+                                             config.SCREEN_WIDTH // 2 - 100, 450)
+            self.mark_dirty(self.menu_rect)
 
@@ -8,3 +8,7 @@ from game.systems.items import Item, GoldenEgg, Food, SecretItem
 from game.systems.effects import Effect, SpeedUp, SpeedDown, VisionUp, VisionDown, HungerRateDown, HungerInstantUp, FoodBoost, DoubleReward, InvincibleOnMaxHunger
 from game.systems.merchant import Merchant, RouletteSlot
 from game.systems.camera import Camera
+from game.systems.vision import VisionField
+from game.systems.spatial import SpatialHash
+from game.systems.endless import ChunkedMaze
+from game.systems.timers import Scheduler
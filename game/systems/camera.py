@@ -11,11 +11,18 @@ class Camera:
         self.y = 0
         self.target_x = 0
         self.target_y = 0
+        # 직전 틱 위치와 렌더링용 보간 위치
+        self.prev_x = 0
+        self.prev_y = 0
+        self.view_x = 0
+        self.view_y = 0
     
     def update(self, target_x, target_y, dt):
         """카메라 업데이트 (부드러운 추적)"""
         self.target_x = target_x
         self.target_y = target_y
+        self.prev_x = self.x
+        self.prev_y = self.y
         
         # 부드러운 추적
         dx = self.target_x - self.x
@@ -23,12 +30,19 @@ class Camera:
         
         self.x += dx * config.CAMERA_FOLLOW_SPEED * dt
         self.y += dy * config.CAMERA_FOLLOW_SPEED * dt
+        self.view_x = self.x
+        self.view_y = self.y
+    
+    def interpolate(self, alpha):
+        """직전 틱과 현재 틱 사이 위치로 렌더링 위치 설정 (alpha: 0~1)"""
+        self.view_x = self.prev_x + (self.x - self.prev_x) * alpha
+        self.view_y = self.prev_y + (self.y - self.prev_y) * alpha
     
     def apply(self, position):
         """월드 좌표 → 화면 좌표 변환"""
         world_x, world_y = position
-        screen_x = world_x - self.x + config.SCREEN_WIDTH // 2
-        screen_y = world_y - self.y + config.SCREEN_HEIGHT // 2
+        screen_x = world_x - self.view_x + config.SCREEN_WIDTH // 2
+        screen_y = world_y - self.view_y + config.SCREEN_HEIGHT // 2
         return (screen_x, screen_y)
     
     def is_visible(self, position, margin=100):
@@ -39,9 +53,9 @@ class Camera:
     
     def get_view_bounds(self):
         """카메라가 보는 범위 (월드 좌표)"""
-        left = self.x - config.SCREEN_WIDTH // 2
-        right = self.x + config.SCREEN_WIDTH // 2
-        top = self.y - config.SCREEN_HEIGHT // 2
-        bottom = self.y + config.SCREEN_HEIGHT // 2
+        left = self.view_x - config.SCREEN_WIDTH // 2
+        right = self.view_x + config.SCREEN_WIDTH // 2
+        top = self.view_y - config.SCREEN_HEIGHT // 2
+        bottom = self.view_y + config.SCREEN_HEIGHT // 2
         return (left, top, right, bottom)
 
@@ -6,32 +6,48 @@ from game.core import config
 
 class Effect:
     """효과 베이스 클래스"""
+    __slots__ = ("type", "duration", "value", "active", "stacks", "expiry_times")
+    conditional = False  # True면 조건이 깨질 때 만료 (is_satisfied로 확인)
+    
     def __init__(self, effect_type, duration, value):
         self.type = effect_type
-        self.duration = duration  # -1은 영구
+        self.duration = duration  # -1은 영구, 0은 즉시 효과
         self.value = value
         self.active = True
-        self.time_remaining = duration
+        self.stacks = 1  # 같은 종류/값/지속시간 효과 중첩 수
+        self.expiry_times = []  # 중첩별 만료 시각 (플레이어 시계 기준, 오름차순)
+    
+    @property
+    def stack_key(self):
+        """중첩 판정 키"""
+        return (self.type, self.value, self.duration)
+    
+    def is_instant(self):
+        """적용 즉시 끝나는 효과인지 확인"""
+        return self.duration == 0
     
     def apply(self, player):
         """효과 적용"""
         pass
     
-    def update(self, player, dt):
-        """효과 갱신"""
-        if self.duration > 0:
-            self.time_remaining -= dt
-            if self.time_remaining <= 0:
-                self.expire(player)
-                return False
+    def is_satisfied(self, player):
+        """조건부 효과 유지 조건"""
         return True
     
+    def time_remaining(self, now):
+        """가장 먼저 끝나는 중첩의 남은 시간"""
+        if not self.expiry_times:
+            return 0.0
+        return max(0.0, self.expiry_times[0] - now)
+    
     def expire(self, player):
         """효과 만료"""
         self.active = False
 
 class SpeedUp(Effect):
     """이동 속도 증가"""
+    __slots__ = ()
+    
     def __init__(self, duration=config.EFFECT_SPEED_UP_DURATION, value=config.EFFECT_SPEED_UP_VALUE):
         super().__init__("speed_up", duration, value)
     
@@ -40,6 +56,8 @@ class SpeedUp(Effect):
 
 class SpeedDown(Effect):
     """이동 속도 감소"""
+    __slots__ = ()
+    
     def __init__(self, duration=config.EFFECT_SPEED_DOWN_DURATION, value=config.EFFECT_SPEED_DOWN_VALUE):
         super().__init__("speed_down", duration, value)
     
@@ -48,6 +66,8 @@ class SpeedDown(Effect):
 
 class VisionUp(Effect):
     """시야 증가"""
+    __slots__ = ()
+    
     def __init__(self, duration=config.EFFECT_VISION_UP_DURATION, value=config.EFFECT_VISION_UP_VALUE):
         super().__init__("vision_up", duration, value)
     
@@ -56,6 +76,8 @@ class VisionUp(Effect):
 
 class VisionDown(Effect):
     """시야 감소"""
+    __slots__ = ()
+    
     def __init__(self, duration=config.EFFECT_VISION_DOWN_DURATION, value=config.EFFECT_VISION_DOWN_VALUE):
         super().__init__("vision_down", duration, value)
     
@@ -64,6 +86,8 @@ class VisionDown(Effect):
 
 class HungerRateDown(Effect):
     """배고픔 감소 속도 감소"""
+    __slots__ = ()
+    
     def __init__(self, duration=config.EFFECT_HUNGER_RATE_DOWN_DURATION, value=config.EFFECT_HUNGER_RATE_DOWN_VALUE):
         super().__init__("hunger_rate_down", duration, value)
     
@@ -72,6 +96,8 @@ class HungerRateDown(Effect):
 
 class HungerInstantUp(Effect):
     """배고픔 즉시 회복"""
+    __slots__ = ()
+    
     def __init__(self, value=config.EFFECT_HUNGER_INSTANT_UP_VALUE):
         super().__init__("hunger_instant_up", 0, value)  # 즉시 효과, duration=0
     
@@ -80,6 +106,8 @@ class HungerInstantUp(Effect):
 
 class FoodBoost(Effect):
     """음식 회복량 증가"""
+    __slots__ = ()
+    
     def __init__(self, duration=config.EFFECT_FOOD_BOOST_DURATION):
         super().__init__("food_boost", duration, config.FOOD_BOOST_MULTIPLIER)
     
@@ -88,6 +116,8 @@ class FoodBoost(Effect):
 
 class DoubleReward(Effect):
     """보상 2배"""
+    __slots__ = ()
+    
     def __init__(self, duration=config.EFFECT_DOUBLE_REWARD_DURATION):
         super().__init__("double_reward", duration, 2.0)
     
@@ -96,18 +126,18 @@ class DoubleReward(Effect):
 
 class InvincibleOnMaxHunger(Effect):
     """배고픔 최대일 때 무적"""
+    __slots__ = ()
+    conditional = True
+    
     def __init__(self, duration=-1):  # 영구
         super().__init__("invincible_on_max_hunger", duration, 1.0)
     
     def apply(self, player):
         player.has_invincible_on_max_hunger = True
     
-    def update(self, player, dt):
+    def is_satisfied(self, player):
         # 배고픔이 최대가 아니면 효과 비활성화
-        if player.hunger < player.max_hunger:
-            self.expire(player)
-            return False
-        return True
+        return player.hunger >= player.max_hunger
 
 # 좋은 효과 목록 (룰렛 weight 조정용)
 GOOD_EFFECTS = ["speed_up", "vision_up", "hunger_rate_down", "hunger_instant_up", "food_boost"]
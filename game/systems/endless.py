@@ -0,0 +1,313 @@
+"""
+무한 모드 미로 - seed 파생 청크를 필요할 때 생성하고 멀어지면 버림
+
+월드는 (0, 0) 청크에서 오른쪽/아래로 끝없이 이어진다 (음수 좌표 없음).
+"""
+
+from array import array
+from collections import OrderedDict
+from game.core import config
+from game.core import rng
+from game.systems import items
+from game.systems import item_store
+from game.systems import merchant
+from game.systems import spatial
+
+class MazeChunk:
+    """무한 미로 청크 하나 (chunk_tiles x chunk_tiles)"""
+    def __init__(self, cx, cy, cells):
+        self.cx = cx
+        self.cy = cy
+        self.cells = cells  # 행 우선 bytearray, 0=벽, 1=길
+        self.items = item_store.ItemStore(bucket_tiles=4)
+        self.merchants = []
+
+class ChunkState:
+    """청크가 버려져도 남기는 기록 (획득한 아이템 비트셋 + 상인별 거래 횟수)"""
+    __slots__ = ("picked", "merchant_trades")
+    
+    def __init__(self, chunk_tiles):
+        self.picked = bytearray((chunk_tiles * chunk_tiles + 7) // 8)  # 청크 내 타일 인덱스 비트
+        self.merchant_trades = None  # 청크 내 상인 순서대로 traded_times (array)
+
+class ChunkedMaze:
+    """끝없는 미로 (Maze와 같은 조회 인터페이스)"""
+    def __init__(self, chunk_tiles=config.ENDLESS_CHUNK_TILES, max_chunks=config.ENDLESS_MAX_CHUNKS,
+                 max_chunk_states=config.ENDLESS_MAX_CHUNK_STATES):
+        self.chunk_tiles = chunk_tiles
+        self.max_chunks = max_chunks
+        self.max_chunk_states = max_chunk_states
+        self.seed = None
+        self.start_pos = (1, 1)
+        self.exit_pos = None  # 출구 없음
+        self.chunks = OrderedDict()  # (cx, cy) -> MazeChunk, 최근 사용 순
+        self.item_index = {}
+        self.merchant_index = spatial.SpatialHash()
+        self.chunk_states = OrderedDict()  # (cx, cy) -> ChunkState (재생성 시 복원, LRU)
+        self._items_list = None  # 로드된 청크 아이템 목록 (청크가 바뀌면 무효화)
+        self._merchants = None
+        self.roulette_rng = None  # 모든 상인이 공유
+        self.food_rng = None  # 모든 음식이 공유
+    
+    def generate(self, stats):
+        """seed 설정 및 시작 청크 생성"""
+        if stats.random_seed is None:
+            stats.random_seed = rng.new_run_seed()
+        self.seed = stats.random_seed
+        self.roulette_rng = rng.derive_rng(self.seed, rng.STREAM_ROULETTE)
+        self.food_rng = rng.derive_rng(self.seed, rng.STREAM_FOOD_HEAL)
+        
+        self.chunks.clear()
+        self.item_index = {}
+        self.merchant_index = spatial.SpatialHash()
+        self.chunk_states = OrderedDict()
+        self._items_list = None
+        self._merchants = None
+        
+        # 시작 지점 주변은 시작 전에 모두 생성 (이후로는 프레임당 budget개)
+        radius = config.ENDLESS_PREFETCH_RADIUS
+        self.stream(*self.start_pos, budget=(radius * 2 + 1) ** 2)
+    
+    def get_loaded_chunk(self, cx, cy):
+        """이미 생성된 청크 (없으면 None, 생성하지 않음)"""
+        return self.chunks.get((cx, cy))
+    
+    def get_chunk(self, cx, cy):
+        """청크 가져오기 (없으면 즉시 생성)"""
+        chunk = self.chunks.get((cx, cy))
+        if chunk is None:
+            return self._load_chunk(cx, cy)
+        self.chunks.move_to_end((cx, cy))
+        return chunk
+    
+    def stream(self, tile_x, tile_y, budget=config.ENDLESS_CHUNKS_PER_FRAME):
+        """플레이어 주변 청크 유지 및 미생성 청크를 가까운 순으로 budget개까지 생성"""
+        center_x = tile_x // self.chunk_tiles
+        center_y = tile_y // self.chunk_tiles
+        radius = config.ENDLESS_PREFETCH_RADIUS
+        
+        missing = []
+        for cy in range(max(0, center_y - radius), center_y + radius + 1):
+            for cx in range(max(0, center_x - radius), center_x + radius + 1):
+                if (cx, cy) in self.chunks:
+                    self.chunks.move_to_end((cx, cy))
+                else:
+                    missing.append((abs(cx - center_x) + abs(cy - center_y), cx, cy))
+        
+        missing.sort()
+        for _, cx, cy in missing[:budget]:
+            self._load_chunk(cx, cy)
+    
+    def _load_chunk(self, cx, cy):
+        """청크 생성 및 인덱스 등록 (초과 시 가장 오래된 청크 제거)"""
+        chunk = self._generate_chunk(cx, cy)
+        self.chunks[(cx, cy)] = chunk
+        self._items_list = None
+        self._merchants = None
+        
+        state = self.chunk_states.get((cx, cy))
+        if state is not None:
+            self.chunk_states.move_to_end((cx, cy))
+        for item in chunk.items:
+            tile_pos = item.get_tile_pos()
+            if state is not None and self._is_picked(state, *tile_pos):
+                item.picked = True
+                chunk.items.mark_picked(item)
+            else:
+                self.item_index.setdefault(tile_pos, []).append(item)
+        if state is not None and state.merchant_trades is not None:
+            for m, traded_times in zip(chunk.merchants, state.merchant_trades):
+                m.traded_times = traded_times
+        for m in chunk.merchants:
+            self.merchant_index.insert(*m.get_tile_pos(), m)
+        
+        while len(self.chunks) > self.max_chunks:
+            self._evict_oldest()
+        return chunk
+    
+    def _evict_oldest(self):
+        """가장 오래 사용하지 않은 청크 제거 (상인 거래 횟수는 기록으로 남김)"""
+        key, chunk = self.chunks.popitem(last=False)
+        self._items_list = None
+        self._merchants = None
+        for item in chunk.items:
+            self.item_index.pop(item.get_tile_pos(), None)
+        for m in chunk.merchants:
+            self.merchant_index.remove(*m.get_tile_pos(), m)
+        if any(m.traded_times for m in chunk.merchants):
+            self._get_chunk_state(key).merchant_trades = array('I', (m.traded_times for m in chunk.merchants))
+    
+    def _get_chunk_state(self, key):
+        """청크 기록 가져오기 (없으면 생성, 초과 시 가장 오래된 기록 제거)"""
+        state = self.chunk_states.get(key)
+        if state is None:
+            state = ChunkState(self.chunk_tiles)
+            self.chunk_states[key] = state
+            while len(self.chunk_states) > self.max_chunk_states:
+                self.chunk_states.popitem(last=False)
+        else:
+            self.chunk_states.move_to_end(key)
+        return state
+    
+    def _is_picked(self, state, tile_x, tile_y):
+        """청크 기록에서 타일의 아이템 획득 여부"""
+        i = (tile_y % self.chunk_tiles) * self.chunk_tiles + tile_x % self.chunk_tiles
+        return bool(state.picked[i >> 3] & (1 << (i & 7)))
+    
+    def _generate_chunk(self, cx, cy):
+        """청크 내부 DFS 미로 + 서쪽/북쪽 문 + 오브젝트 배치 (청크 seed 기반)"""
+        layout_rng = rng.derive_rng(self.seed, rng.STREAM_MAZE_LAYOUT, cx, cy)
+        placement_rng = rng.derive_rng(self.seed, rng.STREAM_ITEM_PLACEMENT, cx, cy)
+        size = self.chunk_tiles
+        half = size // 2
+        cells = bytearray(size * size)
+        
+        # 셀은 청크 내 홀수 좌표, 0번 행/열은 이웃 청크와의 경계 벽
+        start = (layout_rng.randrange(half) * 2 + 1, layout_rng.randrange(half) * 2 + 1)
+        stack = [start]
+        cells[start[1] * size + start[0]] = 1
+        directions = [(0, 2), (2, 0), (0, -2), (-2, 0)]
+        
+        while stack:
+            x, y = stack[-1]
+            neighbors = []
+            for dx, dy in directions:
+                nx, ny = x + dx, y + dy
+                if 0 < nx < size and 0 < ny < size and not cells[ny * size + nx]:
+                    neighbors.append((nx, ny))
+            
+            if neighbors:
+                nx, ny = layout_rng.choice(neighbors)
+                cells[((y + ny) // 2) * size + (x + nx) // 2] = 1
+                cells[ny * size + nx] = 1
+                stack.append((nx, ny))
+            else:
+                stack.pop()
+        
+        # 서쪽/북쪽 경계에 문 하나씩 (동쪽/남쪽 문은 이웃 청크가 만듦)
+        west_door = (layout_rng.randrange(half) * 2 + 1) * size
+        north_door = layout_rng.randrange(half) * 2 + 1
+        if cx > 0:
+            cells[west_door] = 1
+        if cy > 0:
+            cells[north_door] = 1
+        
+        chunk = MazeChunk(cx, cy, cells)
+        origin_x = cx * size
+        origin_y = cy * size
+        
+        for local_y in range(size):
+            for local_x in range(size):
+                if not cells[local_y * size + local_x]:
+                    continue
+                x = origin_x + local_x
+                y = origin_y + local_y
+                
+                if placement_rng.random() < config.ITEM_DENSITY:
+                    if placement_rng.random() < 0.3:  # 30% 확률로 황금알
+                        item = items.GoldenEgg(x * config.TILE_SIZE, y * config.TILE_SIZE)
+                    else:
+                        item = items.Food(x * config.TILE_SIZE, y * config.TILE_SIZE, self.food_rng)
+                    chunk.items.append(item)
+                
+                # 시작점 근처는 상인 제외
+                if abs(x - self.start_pos[0]) < 3 and abs(y - self.start_pos[1]) < 3:
+                    continue
+                if placement_rng.random() < config.MERCHANT_DENSITY:
+                    chunk.merchants.append(merchant.Merchant(x * config.TILE_SIZE, y * config.TILE_SIZE, self.roulette_rng))
+        
+        return chunk
+    
+    @property
+    def items_list(self):
+        """로드된 청크의 아이템 (청크가 바뀔 때만 다시 모음)"""
+        if self._items_list is None:
+            self._items_list = [item for chunk in self.chunks.values() for item in chunk.items]
+        return self._items_list
+    
+    @property
+    def merchants(self):
+        """로드된 청크의 상인 (청크가 바뀔 때만 다시 모음)"""
+        if self._merchants is None:
+            self._merchants = [m for chunk in self.chunks.values() for m in chunk.merchants]
+        return self._merchants
+    
+    def in_bounds(self, tile_x, tile_y):
+        """타일이 월드 안인지 확인 (오른쪽/아래로는 끝없음)"""
+        return tile_x >= 0 and tile_y >= 0
+    
+    def is_walkable(self, tile_x, tile_y):
+        """타일이 이동 가능한지 확인 (아직 생성되지 않은 청크는 stream이 만들 때까지 벽)"""
+        if tile_x < 0 or tile_y < 0:
+            return False
+        cx, local_x = divmod(tile_x, self.chunk_tiles)
+        cy, local_y = divmod(tile_y, self.chunk_tiles)
+        chunk = self.chunks.get((cx, cy))
+        if chunk is None:
+            return False
+        return chunk.cells[local_y * self.chunk_tiles + local_x] == 1
+    
+    def get_item_at(self, x, y):
+        """위치의 아이템 가져오기"""
+        bucket = self.item_index.get((int(x / config.TILE_SIZE), int(y / config.TILE_SIZE)))
+        if not bucket:
+            return None
+        for item in bucket:
+            if not item.picked:
+                return item
+        return None
+    
+    def pick_item(self, item, player, stats):
+        """아이템 획득 처리 (청크가 다시 생성돼도 획득 상태 유지)"""
+        item.on_pick(player, stats)
+        if item.picked:
+            tile_x, tile_y = tile_pos = item.get_tile_pos()
+            chunk_key = (tile_x // self.chunk_tiles, tile_y // self.chunk_tiles)
+            state = self._get_chunk_state(chunk_key)
+            i = (tile_y % self.chunk_tiles) * self.chunk_tiles + tile_x % self.chunk_tiles
+            state.picked[i >> 3] |= 1 << (i & 7)
+            self.item_index.pop(tile_pos, None)
+            chunk = self.chunks.get(chunk_key)
+            if chunk is not None:
+                chunk.items.mark_picked(item)
+    
+    def render_items(self, screen, camera, resources):
+        """화면과 겹치는 청크의 미획득 아이템 렌더링"""
+        chunk_pixels = self.chunk_tiles * config.TILE_SIZE
+        left, top, right, bottom = camera.get_view_bounds()
+        # 스프라이트가 걸쳐 보이는 왼쪽/위쪽 한 타일 여유
+        for cy in range(max(0, int((top - config.TILE_SIZE) // chunk_pixels)), int(bottom // chunk_pixels) + 1):
+            for cx in range(max(0, int((left - config.TILE_SIZE) // chunk_pixels)), int(right // chunk_pixels) + 1):
+                chunk = self.chunks.get((cx, cy))
+                if chunk is not None:
+                    chunk.items.render(screen, camera, resources)
+    
+    def get_merchant_at(self, x, y, radius=config.MERCHANT_INTERACT_RADIUS):
+        """위치 근처의 상인 가져오기"""
+        tile_x = int(x / config.TILE_SIZE)
+        tile_y = int(y / config.TILE_SIZE)
+        return self.merchant_index.query_radius(tile_x, tile_y, radius)
+    
+    def get_secret_room_at(self, x, y):
+        """무한 모드에는 비밀 방 없음"""
+        return None
+    
+    def is_exit(self, tile_x, tile_y):
+        """무한 모드에는 출구 없음"""
+        return False
+    
+    def mark_explored(self, tiles):
+        """무한 모드는 탐험 기록을 남기지 않음 (청크가 버려지므로)"""
+        return []
+    
+    def is_explored(self, tile_x, tile_y):
+        """무한 모드는 탐험 기록을 남기지 않음"""
+        return False
+    
+    def distance_to_exit(self, tile_x, tile_y):
+        """무한 모드에는 출구 없음"""
+        return None
+    
+    def direction_to_exit(self, tile_x, tile_y):
+        """무한 모드에는 출구 없음"""
+        return None
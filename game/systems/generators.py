@@ -0,0 +1,138 @@
+"""
+미로 생성 알고리즘 레지스트리 - DFS 외 Eller(행 스트리밍), Kruskal(유니온 파인드)
+
+생성 함수는 func(maze, rng) 형태이며 maze.grid에 길(1)을 새긴다.
+셀은 홀수 좌표 (1, 1), (3, 1), ... 이고 그 사이 짝수 좌표가 벽/통로다.
+"""
+
+from array import array
+
+# 이름 -> 생성 함수
+GENERATORS = {}
+
+def register_generator(name):
+    """미로 생성 알고리즘 등록 데코레이터"""
+    def decorator(func):
+        GENERATORS[name] = func
+        return func
+    return decorator
+
+def iter_eller_rows(width, height, rng):
+    """Eller 알고리즘으로 미로를 한 행씩 생성 (상태는 O(width))"""
+    cols = (width - 1) // 2
+    rows = (height - 1) // 2
+    
+    # 맨 윗줄은 벽
+    yield bytearray(width)
+    emitted = 1
+    
+    sets = list(range(cols))  # 열 -> 집합 ID
+    members = {set_id: [set_id] for set_id in sets}  # 집합 ID -> 열 목록
+    next_set = cols
+    
+    for r in range(rows):
+        last_row = r == rows - 1
+        
+        # 셀 행: 인접한 다른 집합끼리 가로로 연결 (마지막 행은 모두 연결)
+        cell_row = bytearray(width)
+        for c in range(cols):
+            cell_row[2 * c + 1] = 1
+        for c in range(cols - 1):
+            left, right = sets[c], sets[c + 1]
+            if left != right and (last_row or rng.random() < 0.5):
+                cell_row[2 * c + 2] = 1
+                # 작은 집합을 큰 집합에 병합
+                if len(members[left]) < len(members[right]):
+                    left, right = right, left
+                for col in members[right]:
+                    sets[col] = left
+                members[left].extend(members.pop(right))
+        yield cell_row
+        emitted += 1
+        
+        if last_row:
+            break
+        
+        # 아래 행: 집합마다 최소 한 칸은 아래로 연결
+        below_row = bytearray(width)
+        new_sets = [-1] * cols
+        new_members = {}
+        for set_id in dict.fromkeys(sets):
+            cols_in_set = members[set_id]
+            going_down = [col for col in cols_in_set if rng.random() < 0.5]
+            if not going_down:
+                going_down = [rng.choice(cols_in_set)]
+            for col in going_down:
+                below_row[2 * col + 1] = 1
+                new_sets[col] = set_id
+            new_members[set_id] = going_down
+        
+        # 위와 연결되지 않은 칸은 새 집합
+        for c in range(cols):
+            if new_sets[c] < 0:
+                new_sets[c] = next_set
+                new_members[next_set] = [c]
+                next_set += 1
+        
+        sets = new_sets
+        members = new_members
+        yield below_row
+        emitted += 1
+    
+    # 남은 아랫줄은 벽
+    for _ in range(emitted, height):
+        yield bytearray(width)
+
+@register_generator("eller")
+def generate_eller(maze, rng):
+    """Eller 알고리즘 (행 단위 스트림을 그리드에 기록)"""
+    for y, row in enumerate(iter_eller_rows(maze.width, maze.height, rng)):
+        maze.grid[y][:] = row
+
+@register_generator("kruskal")
+def generate_kruskal(maze, rng):
+    """무작위 Kruskal 알고리즘 (유니온 파인드)"""
+    cols = (maze.width - 1) // 2
+    rows = (maze.height - 1) // 2
+    grid = maze.grid
+    
+    for r in range(rows):
+        for c in range(cols):
+            grid[2 * r + 1][2 * c + 1] = 1
+    
+    # 간선 = 셀 번호 * 2 + 방향 (0=오른쪽, 1=아래)
+    edges = array('I')
+    for r in range(rows):
+        for c in range(cols):
+            cell = r * cols + c
+            if c + 1 < cols:
+                edges.append(cell * 2)
+            if r + 1 < rows:
+                edges.append(cell * 2 + 1)
+    rng.shuffle(edges)
+    
+    parent = array('I', range(cols * rows))
+    size = array('I', [1]) * (cols * rows)
+    
+    def find(cell):
+        while parent[cell] != cell:
+            parent[cell] = parent[parent[cell]]  # 경로 절반 압축
+            cell = parent[cell]
+        return cell
+    
+    for edge in edges:
+        cell, direction = divmod(edge, 2)
+        other = cell + (cols if direction else 1)
+        root_a, root_b = find(cell), find(other)
+        if root_a == root_b:
+            continue
+        if size[root_a] < size[root_b]:
+            root_a, root_b = root_b, root_a
+        parent[root_b] = root_a
+        size[root_a] += size[root_b]
+        
+        r, c = divmod(cell, cols)
+        if direction:
+            grid[2 * r + 2][2 * c + 1] = 1
+        else:
+            grid[2 * r + 1][2 * c + 2] = 1
@@ -0,0 +1,104 @@
+"""
+ItemStore - 아이템 위치/종류/획득 여부를 병렬 배열로 보관 (화면 컬링 후 일괄 blit)
+"""
+
+from array import array
+from game.core import config
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class ItemStore:
+    """아이템 객체 리스트 + 병렬 배열 (x, y, kind, picked)"""
+    def __init__(self, bucket_tiles=config.MAZE_CHUNK_TILES):
+        self.items = []
+        self.xs = array('d')
+        self.ys = array('d')
+        self.kinds = array('B')  # sprite_keys 인덱스
+        self.picked = bytearray()
+        self.sprite_keys = []
+        self._kind_of = {}  # 스프라이트 키 -> kind
+        self._index_of = {}  # 아이템 -> 배열 위치
+        self._bucket_pixels = bucket_tiles * config.TILE_SIZE
+        self._buckets = {}  # (bucket_x, bucket_y) -> 인덱스 리스트 (numpy 없을 때 컬링용)
+        self._views = None  # numpy 뷰 (배열이 늘어나면 무효화)
+    
+    def __len__(self):
+        return len(self.items)
+    
+    def __iter__(self):
+        return iter(self.items)
+    
+    def append(self, item):
+        """아이템 추가"""
+        kind = self._kind_of.get(item.sprite_key)
+        if kind is None:
+            kind = len(self.sprite_keys)
+            self._kind_of[item.sprite_key] = kind
+            self.sprite_keys.append(item.sprite_key)
+        
+        # numpy 뷰가 버퍼를 잡고 있으면 배열 크기를 바꿀 수 없음
+        self._views = None
+        index = len(self.items)
+        self.items.append(item)
+        self.xs.append(item.x)
+        self.ys.append(item.y)
+        self.kinds.append(kind)
+        self.picked.append(1 if item.picked else 0)
+        self._index_of[item] = index
+        
+        if numpy is None:
+            key = (int(item.x // self._bucket_pixels), int(item.y // self._bucket_pixels))
+            self._buckets.setdefault(key, []).append(index)
+    
+    def mark_picked(self, item):
+        """획득 상태 반영"""
+        index = self._index_of.get(item)
+        if index is not None:
+            self.picked[index] = 1
+    
+    def _get_views(self):
+        """배열 버퍼를 복사 없이 numpy 배열로 보기"""
+        if self._views is None:
+            self._views = (numpy.frombuffer(self.xs, dtype=numpy.float64),
+                           numpy.frombuffer(self.ys, dtype=numpy.float64),
+                           numpy.frombuffer(self.picked, dtype=numpy.uint8))
+        return self._views
+    
+    def visible_indices(self, left, top, right, bottom):
+        """범위 안의 미획득 아이템 인덱스"""
+        if not self.items:
+            return []
+        
+        if numpy is not None:
+            xs, ys, picked = self._get_views()
+            mask = (xs >= left) & (xs < right) & (ys >= top) & (ys < bottom) & (picked == 0)
+            return numpy.flatnonzero(mask).tolist()
+        
+        # numpy가 없으면 범위와 겹치는 버킷만 검사
+        xs, ys, picked = self.xs, self.ys, self.picked
+        size = self._bucket_pixels
+        indices = []
+        for bucket_y in range(int(top // size), int(bottom // size) + 1):
+            for bucket_x in range(int(left // size), int(right // size) + 1):
+                for i in self._buckets.get((bucket_x, bucket_y), ()):
+                    if not picked[i] and left <= xs[i] < right and top <= ys[i] < bottom:
+                        indices.append(i)
+        return indices
+    
+    def render(self, screen, camera, resources):
+        """화면과 겹치는 미획득 아이템만 한 번에 blit"""
+        left, top, right, bottom = camera.get_view_bounds()
+        indices = self.visible_indices(left - config.TILE_SIZE, top - config.TILE_SIZE, right, bottom)
+        if not indices:
+            return
+        
+        # 모든 스프라이트를 아틀라스 한 장에서 영역만 달리해 blit
+        atlas = resources.get_atlas()
+        areas = [resources.get_sprite_rect(key) for key in self.sprite_keys]
+        offset_x, offset_y = camera.apply((0, 0))
+        xs, ys, kinds = self.xs, self.ys, self.kinds
+        screen.blits([(atlas, (xs[i] + offset_x, ys[i] + offset_y), areas[kinds[i]]) for i in indices],
+                     doreturn=False)
@@ -8,6 +8,8 @@ from game.systems import effects
 
 class Item:
     """아이템 베이스 클래스"""
+    __slots__ = ("x", "y", "sprite_key", "picked")
+    
     def __init__(self, x, y, sprite_key="item_default"):
         self.x = x
         self.y = y
@@ -18,6 +20,10 @@ class Item:
         """아이템 획득 시 호출"""
         pass
     
+    def get_tile_pos(self):
+        """타일 좌표 반환"""
+        return (int(self.x / config.TILE_SIZE), int(self.y / config.TILE_SIZE))
+    
     def render(self, screen, camera, resources):
         """아이템 렌더링"""
         if self.picked:
@@ -30,6 +36,8 @@ class Item:
 
 class GoldenEgg(Item):
     """황금알"""
+    __slots__ = ()
+    
     def __init__(self, x, y):
         super().__init__(x, y, "golden_egg")
     
@@ -43,18 +51,21 @@ class GoldenEgg(Item):
         
         # 황금 파티클 효과 (시각적 표현은 나중에 추가 가능)
         # 사운드 재생
-        if hasattr(player, 'resources') and player.resources:
+        if player.resources:
             player.resources.play_sound("sfx_golden_egg", 0.5)
         
         # DoubleReward 효과가 있으면 추가 획득
-        if hasattr(player, 'has_double_reward') and player.has_double_reward:
+        if player.has_double_reward:
             player.eggs += 1
             stats.total_eggs += 1
 
 class Food(Item):
     """음식"""
-    def __init__(self, x, y):
+    __slots__ = ("rng",)
+    
+    def __init__(self, x, y, rng=None):
         super().__init__(x, y, "food")
+        self.rng = rng if rng is not None else random.Random()  # 회복량 난수 스트림
     
     def on_pick(self, player, stats):
         if self.picked:
@@ -63,20 +74,22 @@ class Food(Item):
         self.picked = True
         
         # 회복량 계산
-        heal_amount = random.randint(config.FOOD_HEAL_MIN, config.FOOD_HEAL_MAX)
+        heal_amount = self.rng.randint(config.FOOD_HEAL_MIN, config.FOOD_HEAL_MAX)
         
         # FoodBoost 효과가 있으면 추가 회복
-        if hasattr(player, 'has_food_boost') and player.has_food_boost:
+        if player.has_food_boost:
             heal_amount = int(heal_amount * config.FOOD_BOOST_MULTIPLIER)
         
         player.hunger = min(player.max_hunger, player.hunger + heal_amount)
         
         # 사운드 재생
-        if hasattr(player, 'resources') and player.resources:
+        if player.resources:
             player.resources.play_sound("sfx_food", 0.3)
 
 class SecretItem(Item):
     """비밀 방 전용 아이템 (거위 깃털)"""
+    __slots__ = ("effect_applied",)
+    
     def __init__(self, x, y):
         super().__init__(x, y, "secret_item")
         self.effect_applied = False
@@ -97,6 +110,6 @@ class SecretItem(Item):
         stats.secret_rooms_found += 1
         
         # 사운드 재생
-        if hasattr(player, 'resources') and player.resources:
+        if player.resources:
             player.resources.play_sound("sfx_secret_item", 0.4)
 
@@ -2,13 +2,23 @@
 미로 생성 및 오브젝트 배치
 """
 
-import random
+import itertools
+import math
+import sys
+from array import array
 from game.core import config
+from game.core import rng
+from game.systems import generators
 from game.systems import items
+from game.systems import item_store
+from game.systems import maze_cache
 from game.systems import merchant
+from game.systems import spatial
 
 class SecretRoom:
     """비밀 방"""
+    __slots__ = ("x", "y", "items", "found")
+    
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -17,37 +27,221 @@ class SecretRoom:
 
 class Maze:
     """미로 클래스"""
-    def __init__(self, width, height):
+    # 생성 알고리즘 레지스트리 (generators.register_generator로 추가)
+    GENERATORS = generators.GENERATORS
+    
+    def __init__(self, width, height, compact=config.MAZE_COMPACT_GRID, generator=config.MAZE_GENERATOR,
+                 cache=None):
+        if generator not in self.GENERATORS:
+            raise ValueError(f"알 수 없는 미로 생성 알고리즘: {generator}")
         self.width = width
         self.height = height
+        self.compact = compact
+        self.generator = generator
+        if cache is None and config.MAZE_CACHE_ENABLED:
+            cache = maze_cache.MazeCache()
+        self.cache = cache
+        self.cells = None  # 압축 모드: 행 우선 bytearray
         self.grid = []  # 0=벽, 1=길
         self.start_pos = (1, 1)
         self.exit_pos = (width - 2, height - 2)
-        self.items_list = []
+        self.items_list = item_store.ItemStore()
+        self.item_index = {}  # (tile_x, tile_y) -> 미획득 아이템 리스트
         self.merchants = []
+        self.merchant_index = spatial.SpatialHash()
         self.secret_rooms = []
+        self.secret_room_index = spatial.SpatialHash()
+        self.layout_rng = None
+        self.placement_rng = None
+        self.roulette_rng = None  # 모든 상인이 공유
+        self.food_rng = None  # 모든 음식이 공유
+        self.exit_distance = None  # 행 우선 출구 거리장 (array)
+        self.distance_unreachable = 0xFFFF
+        self.exit_reachable = False  # 시작점에서 출구까지 길이 있는지
+        self.explored = bytearray((width * height + 7) // 8)  # 탐험한 타일 비트셋
     
     def generate(self, stats):
         """미로 생성 (seed 기반)"""
-        # seed 설정
-        if stats.random_seed is not None:
-            random.seed(stats.random_seed)
+        # seed 설정 (용도별 독립 스트림, 전역 random은 건드리지 않음)
+        if stats.random_seed is None:
+            stats.random_seed = rng.new_run_seed()
+        seed = stats.random_seed
+        self.layout_rng = rng.derive_rng(seed, rng.STREAM_MAZE_LAYOUT)
+        self.placement_rng = rng.derive_rng(seed, rng.STREAM_ITEM_PLACEMENT)
+        self.roulette_rng = rng.derive_rng(seed, rng.STREAM_ROULETTE)
+        self.food_rng = rng.derive_rng(seed, rng.STREAM_FOOD_HEAL)
+        
+        # 디스크 캐시 우선 (거리장도 캐시에 들어 있음)
+        if self.cache is None or not self._load_from_cache(seed):
+            if self.compact:
+                self._generate_compact(stats)
+            else:
+                # 그리드 초기화 (모두 벽)
+                self.grid = [[0 for _ in range(self.width)] for _ in range(self.height)]
+                
+                # 선택된 알고리즘으로 미로 생성
+                self.GENERATORS[self.generator](self, self.layout_rng)
+                self._carve_exit()
+                
+                # 오브젝트 배치
+                self._place_items(stats)
+                self._place_merchants(stats)
+                self._place_secret_rooms(stats)
+            
+            # 출구 거리장 (생성 직후 1회, 캐시에 함께 저장)
+            self._compute_exit_distance()
+            if self.cache is not None:
+                self.cache.store(self, seed)
+        
+        self._check_exit_reachable()
+    
+    def _compute_exit_distance(self):
+        """출구에서 BFS로 모든 길 타일까지의 거리 계산 (도달 불가는 distance_unreachable)"""
+        width = self.width
+        size = width * self.height
+        
+        # 작은 미로는 2바이트, 큰 미로는 4바이트 거리
+        typecode = maze_cache.distance_typecode(size)
+        unreachable = self.distance_unreachable = maze_cache.DISTANCE_UNREACHABLE[typecode]
+        distance = array(typecode, [unreachable]) * size
+        self.exit_distance = distance
+        
+        # 행 우선 0/1 바이트열에서 직접 탐색 (압축 모드는 복사 없음)
+        if self.cells is not None:
+            floor = self.cells
         else:
-            stats.random_seed = random.randint(0, 2**31 - 1)
-            random.seed(stats.random_seed)
+            floor = b"".join(bytes(row) for row in self.grid)
         
-        # 그리드 초기화 (모두 벽)
-        self.grid = [[0 for _ in range(self.width)] for _ in range(self.height)]
+        exit_index = self.exit_pos[1] * width + self.exit_pos[0]
+        if not floor[exit_index]:
+            return
         
-        # DFS로 미로 생성
-        self._generate_dfs()
+        distance[exit_index] = 0
+        frontier = [exit_index]
+        step = 0
+        last_column = width - 1
+        while frontier:
+            step += 1
+            next_frontier = []
+            append = next_frontier.append
+            for i in frontier:
+                n = i - width
+                if n >= 0 and floor[n] and distance[n] == unreachable:
+                    distance[n] = step
+                    append(n)
+                n = i + width
+                if n < size and floor[n] and distance[n] == unreachable:
+                    distance[n] = step
+                    append(n)
+                x = i % width
+                if x > 0 and floor[i - 1] and distance[i - 1] == unreachable:
+                    distance[i - 1] = step
+                    append(i - 1)
+                if x < last_column and floor[i + 1] and distance[i + 1] == unreachable:
+                    distance[i + 1] = step
+                    append(i + 1)
+            frontier = next_frontier
+    
+    def _check_exit_reachable(self):
+        """시작점에서 출구까지 이어져 있는지 기록 (끊긴 미로는 표준 에러로 알리고 출구 힌트/효율 점수 비활성)"""
+        self.exit_reachable = self.distance_to_exit(*self.start_pos) is not None
+        if not self.exit_reachable:
+            print(f"출구 연결 실패: {self.generator} {self.width}x{self.height} 미로에서 출구에 도달할 수 없음", file=sys.stderr)
+    
+    def distance_to_exit(self, tile_x, tile_y):
+        """출구까지의 최단 거리 (타일 수, 출구와 이어지지 않은 타일이면 None)"""
+        if self.exit_distance is None or not self.in_bounds(tile_x, tile_y):
+            return None
+        d = self.exit_distance[tile_y * self.width + tile_x]
+        return None if d == self.distance_unreachable else d
+    
+    def direction_to_exit(self, tile_x, tile_y):
+        """출구 쪽으로 한 칸 가까워지는 방향 (dx, dy), 출구이거나 도달 불가면 None"""
+        if not self.exit_reachable:
+            return None
+        d = self.distance_to_exit(tile_x, tile_y)
+        if not d:
+            return None
+        for dx, dy in [(0, -1), (0, 1), (-1, 0), (1, 0)]:
+            if self.distance_to_exit(tile_x + dx, tile_y + dy) == d - 1:
+                return (dx, dy)
+        return None
+    
+    def _load_from_cache(self, seed):
+        """캐시 파일에서 그리드와 오브젝트 복원 (생성한 미로와 같은 모드/쓰기 가능한 그리드)"""
+        cached = self.cache.load(self, seed)
+        if cached is None:
+            return False
+        
+        width = self.width
+        if self.compact:
+            self.cells = cached.cells
+            view = memoryview(self.cells)
+            self.grid = [view[y * width:(y + 1) * width] for y in range(self.height)]
+        else:
+            self.cells = None
+            self.grid = [list(cached.cells[y * width:(y + 1) * width]) for y in range(self.height)]
+        self.exit_distance = cached.exit_distance
+        self.distance_unreachable = maze_cache.DISTANCE_UNREACHABLE[cached.exit_distance.typecode]
         
-        # 오브젝트 배치
-        self._place_items(stats)
-        self._place_merchants(stats)
-        self._place_secret_rooms(stats)
+        self.items_list = item_store.ItemStore()
+        self.item_index = {}
+        self.merchants = []
+        self.merchant_index = spatial.SpatialHash()
+        self.secret_rooms = []
+        self.secret_room_index = spatial.SpatialHash()
+        
+        for x, y, kind in cached.item_records:
+            if kind == maze_cache.ITEM_KIND_GOLDEN_EGG:
+                item = items.GoldenEgg(x * config.TILE_SIZE, y * config.TILE_SIZE)
+            else:
+                item = items.Food(x * config.TILE_SIZE, y * config.TILE_SIZE, self.food_rng)
+            self._add_item(item)
+        for x, y in cached.merchant_records:
+            self._add_merchant(x, y)
+        for x, y in cached.room_records:
+            self._add_secret_room(x, y)
+        return True
+    
+    def _generate_compact(self, stats):
+        """압축 그리드 모드 생성 (행 우선 bytearray, 행은 memoryview)"""
+        self.cells = bytearray(self.width * self.height)
+        view = memoryview(self.cells)
+        self.grid = [view[y * self.width:(y + 1) * self.width] for y in range(self.height)]
+        
+        floor_cells = self.GENERATORS[self.generator](self, self.layout_rng)
+        self._carve_exit()
+        if floor_cells is None:
+            floor_cells = self._collect_floor_cells()
+        
+        self._place_items_compact(floor_cells)
+        self._place_merchants_compact(floor_cells)
+        self._place_secret_rooms_compact()
     
-    def _generate_dfs(self):
+    def _carve_exit(self):
+        """출구 확보 후 새로 뚫은 타일 인덱스 반환"""
+        # 셀은 홀수 좌표라 짝수 크기 미로의 출구는 어느 셀과도 이어지지 않음
+        # → 출구에서 가장 가까운 셀(홀수 좌표로 내림)까지 통로를 냄
+        exit_x, exit_y = self.exit_pos
+        cell_x = exit_x if exit_x % 2 else exit_x - 1
+        cell_y = exit_y if exit_y % 2 else exit_y - 1
+        carved = []
+        for x, y in ((exit_x, exit_y), (exit_x, cell_y), (cell_x, cell_y)):
+            if not self.grid[y][x]:
+                self.grid[y][x] = 1
+                carved.append(y * self.width + x)
+        return carved
+    
+    def _collect_floor_cells(self):
+        """압축 그리드의 길 셀 인덱스 배열"""
+        floor_cells = array('I')
+        index = self.cells.find(1)
+        while index >= 0:
+            floor_cells.append(index)
+            index = self.cells.find(1, index + 1)
+        return floor_cells
+    
+    def _generate_dfs(self, layout_rng):
         """DFS 알고리즘으로 미로 생성"""
         stack = [self.start_pos]
         visited = set([self.start_pos])
@@ -71,7 +265,7 @@ class Maze:
             
             if neighbors:
                 # 랜덤하게 선택
-                next_cell = random.choice(neighbors)
+                next_cell = layout_rng.choice(neighbors)
                 nx, ny = next_cell
                 
                 # 중간 벽 제거
@@ -85,26 +279,131 @@ class Maze:
                 stack.pop()
         
         # 출구 확보
-        self.grid[self.exit_pos[1]][self.exit_pos[0]] = 1
+        self._carve_exit()
+    
+    def _generate_dfs_compact(self, layout_rng):
+        """DFS 미로 생성 (방문 비트맵 + 평탄 인덱스 스택), 길 셀 인덱스 배열 반환"""
+        width, height = self.width, self.height
+        cells = self.cells
+        visited = bytearray((width * height + 7) >> 3)
+        floor_cells = array('I')
+        
+        start = self.start_pos[1] * width + self.start_pos[0]
+        stack = array('I', [start])
+        visited[start >> 3] |= 1 << (start & 7)
+        cells[start] = 1
+        floor_cells.append(start)
+        
+        directions = [(0, 2), (2, 0), (0, -2), (-2, 0)]  # 리스트 모드와 같은 순서
+        
+        while stack:
+            current = stack[-1]
+            y, x = divmod(current, width)
+            
+            neighbors = []
+            for dx, dy in directions:
+                nx, ny = x + dx, y + dy
+                if 0 < nx < width - 1 and 0 < ny < height - 1:
+                    n = ny * width + nx
+                    if not visited[n >> 3] & (1 << (n & 7)):
+                        neighbors.append(n)
+            
+            if neighbors:
+                n = layout_rng.choice(neighbors)
+                
+                # 중간 벽 제거 (두 셀 인덱스의 평균)
+                mid = (current + n) >> 1
+                cells[mid] = 1
+                cells[n] = 1
+                floor_cells.append(mid)
+                floor_cells.append(n)
+                
+                visited[n >> 3] |= 1 << (n & 7)
+                stack.append(n)
+            else:
+                stack.pop()
+        
+        # 출구 확보
+        floor_cells.extend(self._carve_exit())
+        
+        return floor_cells
+    
+    def _geometric_skip(self, chance):
+        """chance 확률 독립 시행에서 다음 당첨 전까지의 실패 횟수 (난수 1개)"""
+        return int(math.log(1.0 - self.placement_rng.random()) / math.log(1.0 - chance))
+    
+    def _iter_bernoulli_hits(self, count, chance):
+        """count개 후보 각각을 chance 확률로 뽑은 결과 인덱스 (당첨 수만큼만 난수 사용)"""
+        if chance <= 0:
+            return
+        if chance >= 1:
+            yield from range(count)
+            return
+        
+        index = self._geometric_skip(chance)
+        while index < count:
+            yield index
+            index += self._geometric_skip(chance) + 1
+    
+    def _place_items_compact(self, floor_cells):
+        """아이템 배치 (압축 모드, 당첨 셀만 방문)"""
+        self.items_list = item_store.ItemStore()
+        self.item_index = {}
+        
+        for i in self._iter_bernoulli_hits(len(floor_cells), config.ITEM_DENSITY):
+            y, x = divmod(floor_cells[i], self.width)
+            self._add_random_item(x, y)
+    
+    def _place_merchants_compact(self, floor_cells):
+        """상인 배치 (압축 모드, 당첨 셀만 방문)"""
+        self.merchants = []
+        self.merchant_index = spatial.SpatialHash()
+        
+        for i in self._iter_bernoulli_hits(len(floor_cells), config.MERCHANT_DENSITY):
+            y, x = divmod(floor_cells[i], self.width)
+            # 시작점/출구 근처 당첨은 버림 (나머지 셀의 독립 시행 분포는 동일)
+            if self._is_near_start_or_exit(x, y):
+                continue
+            self._add_merchant(x, y)
+    
+    def _place_secret_rooms_compact(self):
+        """비밀 방 배치 (압축 모드, 최대 3개가 정해질 때까지만 후보 탐색)"""
+        self.secret_rooms = []
+        self.secret_room_index = spatial.SpatialHash()
+        
+        candidates = self._iter_secret_room_candidates()
+        for _ in range(3):  # 최대 3개
+            skip = self._geometric_skip(config.SECRET_ROOM_CHANCE)
+            position = next(itertools.islice(candidates, skip, None), None)
+            if position is None:
+                return
+            self._add_secret_room(*position)
+    
+    def _iter_secret_room_candidates(self):
+        """길과 맞닿은 벽 타일 (행 우선 순서로 지연 생성)"""
+        cells, width = self.cells, self.width
+        for y in range(2, self.height - 2):
+            row_start = y * width
+            for x in range(2, width - 2):
+                i = row_start + x
+                if cells[i] == 0 and (cells[i - 1] or cells[i + 1] or cells[i - width] or cells[i + width]):
+                    yield (x, y)
     
     def _place_items(self, stats):
         """아이템 배치"""
-        self.items_list = []
+        self.items_list = item_store.ItemStore()
+        self.item_index = {}
         
         for y in range(1, self.height - 1):
             for x in range(1, self.width - 1):
                 if self.grid[y][x] == 1:  # 길인 경우
-                    if random.random() < config.ITEM_DENSITY:
-                        # 황금알 또는 음식 랜덤 배치
-                        if random.random() < 0.3:  # 30% 확률로 황금알
-                            item = items.GoldenEgg(x * config.TILE_SIZE, y * config.TILE_SIZE)
-                        else:
-                            item = items.Food(x * config.TILE_SIZE, y * config.TILE_SIZE)
-                        self.items_list.append(item)
+                    if self.placement_rng.random() < config.ITEM_DENSITY:
+                        self._add_random_item(x, y)
     
     def _place_merchants(self, stats):
         """상인 배치"""
         self.merchants = []
+        self.merchant_index = spatial.SpatialHash()
         
         for y in range(1, self.height - 1):
             for x in range(1, self.width - 1):
@@ -115,13 +414,13 @@ class Maze:
                     if (abs(x - self.exit_pos[0]) < 3 and abs(y - self.exit_pos[1]) < 3):
                         continue
                     
-                    if random.random() < config.MERCHANT_DENSITY:
-                        m = merchant.Merchant(x * config.TILE_SIZE, y * config.TILE_SIZE)
-                        self.merchants.append(m)
+                    if self.placement_rng.random() < config.MERCHANT_DENSITY:
+                        self._add_merchant(x, y)
     
     def _place_secret_rooms(self, stats):
         """비밀 방 배치"""
         self.secret_rooms = []
+        self.secret_room_index = spatial.SpatialHash()
         
         # 벽 후보 찾기
         wall_candidates = []
@@ -137,18 +436,72 @@ class Maze:
                                 has_path_nearby = True
                                 break
                     
-                    if has_path_nearby and random.random() < config.SECRET_ROOM_CHANCE:
+                    if has_path_nearby and self.placement_rng.random() < config.SECRET_ROOM_CHANCE:
                         wall_candidates.append((x, y))
         
         # 비밀 방 생성
         for x, y in wall_candidates[:3]:  # 최대 3개
-            secret_room = SecretRoom(x * config.TILE_SIZE, y * config.TILE_SIZE)
-            # 비밀 방에 SecretItem 배치
-            secret_item = items.SecretItem(x * config.TILE_SIZE, y * config.TILE_SIZE)
-            secret_room.items.append(secret_item)
-            self.secret_rooms.append(secret_room)
-            # 비밀 방 위치의 아이템 리스트에도 추가
-            self.items_list.append(secret_item)
+            self._add_secret_room(x, y)
+    
+    def _is_near_start_or_exit(self, x, y):
+        """시작점/출구 주변 (상인 배치 제외 구역)"""
+        if abs(x - self.start_pos[0]) < 3 and abs(y - self.start_pos[1]) < 3:
+            return True
+        return abs(x - self.exit_pos[0]) < 3 and abs(y - self.exit_pos[1]) < 3
+    
+    def _add_random_item(self, x, y):
+        """황금알 또는 음식 랜덤 배치"""
+        if self.placement_rng.random() < 0.3:  # 30% 확률로 황금알
+            item = items.GoldenEgg(x * config.TILE_SIZE, y * config.TILE_SIZE)
+        else:
+            item = items.Food(x * config.TILE_SIZE, y * config.TILE_SIZE, self.food_rng)
+        self._add_item(item)
+    
+    def _add_merchant(self, x, y):
+        """상인 등록"""
+        m = merchant.Merchant(x * config.TILE_SIZE, y * config.TILE_SIZE, self.roulette_rng)
+        self.merchants.append(m)
+        self.merchant_index.insert(x, y, m)
+    
+    def _add_secret_room(self, x, y):
+        """비밀 방 등록"""
+        secret_room = SecretRoom(x * config.TILE_SIZE, y * config.TILE_SIZE)
+        # 비밀 방에 SecretItem 배치
+        secret_item = items.SecretItem(x * config.TILE_SIZE, y * config.TILE_SIZE)
+        secret_room.items.append(secret_item)
+        self.secret_rooms.append(secret_room)
+        self.secret_room_index.insert(x, y, secret_room)
+        # 비밀 방 위치의 아이템 리스트에도 추가
+        self._add_item(secret_item)
+    
+    def _add_item(self, item):
+        """아이템 등록 (타일 인덱스 포함)"""
+        self.items_list.append(item)
+        self.item_index.setdefault(item.get_tile_pos(), []).append(item)
+    
+    def mark_explored(self, tiles):
+        """타일들을 탐험 처리하고 새로 탐험한 타일 목록 반환"""
+        explored = self.explored
+        width = self.width
+        newly_explored = []
+        for x, y in tiles:
+            i = y * width + x
+            bit = 1 << (i & 7)
+            if not explored[i >> 3] & bit:
+                explored[i >> 3] |= bit
+                newly_explored.append((x, y))
+        return newly_explored
+    
+    def is_explored(self, tile_x, tile_y):
+        """이미 본 적 있는 타일인지 확인"""
+        if not self.in_bounds(tile_x, tile_y):
+            return False
+        i = tile_y * self.width + tile_x
+        return bool(self.explored[i >> 3] & (1 << (i & 7)))
+    
+    def in_bounds(self, tile_x, tile_y):
+        """타일이 미로 범위 안인지 확인"""
+        return 0 <= tile_x < self.width and 0 <= tile_y < self.height
     
     def is_walkable(self, tile_x, tile_y):
         """타일이 이동 가능한지 확인"""
@@ -158,40 +511,51 @@ class Maze:
     
     def get_item_at(self, x, y):
         """위치의 아이템 가져오기"""
-        tile_x = int(x / config.TILE_SIZE)
-        tile_y = int(y / config.TILE_SIZE)
-        
-        for item in self.items_list:
-            item_tile_x = int(item.x / config.TILE_SIZE)
-            item_tile_y = int(item.y / config.TILE_SIZE)
-            if item_tile_x == tile_x and item_tile_y == tile_y and not item.picked:
-                return item
-        return None
+        tile_pos = (int(x / config.TILE_SIZE), int(y / config.TILE_SIZE))
+        return self._prune_item_index(tile_pos)
+    
+    def pick_item(self, item, player, stats):
+        """아이템 획득 처리 및 인덱스 갱신"""
+        item.on_pick(player, stats)
+        if item.picked:
+            self.items_list.mark_picked(item)
+        self._prune_item_index(item.get_tile_pos())
+    
+    def _prune_item_index(self, tile_pos):
+        """타일의 획득된 아이템을 인덱스에서 제거하고 남은 첫 아이템 반환"""
+        bucket = self.item_index.get(tile_pos)
+        if bucket is None:
+            return None
+        while bucket and bucket[0].picked:
+            bucket.pop(0)
+        if not bucket:
+            del self.item_index[tile_pos]
+            return None
+        return bucket[0]
     
-    def get_merchant_at(self, x, y, radius=1):
+    def render_items(self, screen, camera, resources):
+        """화면 안의 미획득 아이템 렌더링"""
+        self.items_list.render(screen, camera, resources)
+    
+    def get_merchant_at(self, x, y, radius=config.MERCHANT_INTERACT_RADIUS):
         """위치 근처의 상인 가져오기"""
         tile_x = int(x / config.TILE_SIZE)
         tile_y = int(y / config.TILE_SIZE)
-        
-        for m in self.merchants:
-            m_tile_x, m_tile_y = m.get_tile_pos()
-            if abs(m_tile_x - tile_x) <= radius and abs(m_tile_y - tile_y) <= radius:
-                return m
-        return None
+        return self.merchant_index.query_radius(tile_x, tile_y, radius)
     
     def get_secret_room_at(self, x, y):
         """위치의 비밀 방 가져오기"""
         tile_x = int(x / config.TILE_SIZE)
         tile_y = int(y / config.TILE_SIZE)
-        
-        for room in self.secret_rooms:
-            room_tile_x = int(room.x / config.TILE_SIZE)
-            room_tile_y = int(room.y / config.TILE_SIZE)
-            if room_tile_x == tile_x and room_tile_y == tile_y:
-                return room
-        return None
+        return self.secret_room_index.get_at(tile_x, tile_y)
     
     def is_exit(self, tile_x, tile_y):
         """출구인지 확인"""
         return tile_x == self.exit_pos[0] and tile_y == self.exit_pos[1]
 
+@generators.register_generator("dfs")
+def generate_dfs(maze, layout_rng):
+    """DFS (기본 알고리즘, 압축 모드에서는 길 셀 배열도 반환)"""
+    if maze.compact:
+        return maze._generate_dfs_compact(layout_rng)
+    maze._generate_dfs(layout_rng)
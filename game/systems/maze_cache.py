@@ -0,0 +1,175 @@
+"""
+미로 디스크 캐시 - 비트 패킹 그리드 + 오브젝트 레코드 (mmap으로 읽어 한 번에 풀기)
+
+파일 구조 (리틀 엔디언):
+    헤더 | 그리드 비트 (셀 i = y * width + x, 바이트 i >> 3 의 i & 7 번째 비트)
+    | 아이템 레코드 (tile_x, tile_y, 종류) | 상인 레코드 | 비밀 방 레코드
+    | 출구 거리장 (셀당 uint16, 65535셀 이상이면 uint32)
+"""
+
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from game.core import config
+from game.systems import items
+
+CACHE_FORMAT_VERSION = 2
+
+_MAGIC = b"GMZC"
+# magic, 포맷 버전, 플래그, 가로, 세로, seed, 아이템 수, 상인 수, 비밀 방 수
+_HEADER = struct.Struct("<4sHHIIqIII")
+_ITEM_RECORD = struct.Struct("<IIB")
+_POS_RECORD = struct.Struct("<II")
+
+_FLAG_COMPACT = 1
+
+# 아이템 종류 코드
+ITEM_KIND_GOLDEN_EGG = 0
+ITEM_KIND_FOOD = 1
+
+# 캐시에 저장되는 오브젝트 배치에 영향을 주는 설정 (값이 바뀌면 캐시 키가 달라짐)
+PLACEMENT_CONFIG_KEYS = ("ITEM_DENSITY", "MERCHANT_DENSITY", "SECRET_ROOM_CHANCE")
+
+# 출구 거리장 원소 타입별 도달 불가 값
+DISTANCE_UNREACHABLE = {'H': 0xFFFF, 'I': 0xFFFFFFFF}
+
+def distance_typecode(cell_count):
+    """출구 거리장 array 타입 (작은 미로는 2바이트, 큰 미로는 4바이트)"""
+    return 'H' if cell_count < 0xFFFF else 'I'
+
+def placement_fingerprint():
+    """현재 배치 설정 값의 짧은 해시 (캐시 파일 이름에 포함)"""
+    values = ",".join(f"{key}={getattr(config, key)!r}" for key in PLACEMENT_CONFIG_KEYS)
+    return f"{zlib.crc32(values.encode('ascii')):08x}"
+
+class CachedMaze:
+    """캐시 파일에서 읽은 미로 데이터 (cells: 행 우선 0/1 bytearray)"""
+    def __init__(self, cells, item_records, merchant_records, room_records, exit_distance):
+        self.cells = cells
+        self.exit_distance = exit_distance
+        self.item_records = item_records
+        self.merchant_records = merchant_records
+        self.room_records = room_records
+
+def pack_grid(maze):
+    """그리드를 비트 패킹 bytes로 변환 (셀당 1비트)"""
+    if maze.cells is not None:
+        flat = bytes(maze.cells)
+    else:
+        flat = b"".join(bytes(row) for row in maze.grid)
+    
+    # 0/1 바이트열 → 이진수 문자열 → 정수 (셀 0이 최하위 비트)
+    bit_string = flat.translate(bytes.maketrans(b"\x00\x01", b"01"))[::-1]
+    byte_count = (len(flat) + 7) >> 3
+    if not bit_string:
+        return bytes(byte_count)
+    return int(bit_string, 2).to_bytes(byte_count, "little")
+
+def unpack_grid(packed, cell_count):
+    """비트 패킹 bytes를 셀당 1바이트(0/1) bytearray로 변환 (pack_grid의 역연산)"""
+    # 정수 → 이진수 문자열 → 뒤집기 (셀 0이 최하위 비트)
+    bit_string = bin(int.from_bytes(packed, "little"))[2:].zfill(len(packed) * 8)[::-1]
+    return bytearray(bit_string[:cell_count].encode("ascii").translate(bytes.maketrans(b"01", b"\x00\x01")))
+
+def write_maze_file(path, maze, seed):
+    """미로를 캐시 포맷으로 저장 (임시 파일 후 교체)"""
+    regular_items = [item for item in maze.items_list if not isinstance(item, items.SecretItem)]
+    flags = _FLAG_COMPACT if maze.compact else 0
+    
+    parts = [
+        _HEADER.pack(_MAGIC, CACHE_FORMAT_VERSION, flags, maze.width, maze.height, seed,
+                     len(regular_items), len(maze.merchants), len(maze.secret_rooms)),
+        pack_grid(maze),
+    ]
+    for item in regular_items:
+        kind = ITEM_KIND_GOLDEN_EGG if isinstance(item, items.GoldenEgg) else ITEM_KIND_FOOD
+        parts.append(_ITEM_RECORD.pack(*item.get_tile_pos(), kind))
+    for m in maze.merchants:
+        parts.append(_POS_RECORD.pack(*m.get_tile_pos()))
+    for room in maze.secret_rooms:
+        parts.append(_POS_RECORD.pack(int(room.x / config.TILE_SIZE), int(room.y / config.TILE_SIZE)))
+    
+    distance = maze.exit_distance
+    if sys.byteorder == "big":
+        distance = array(distance.typecode, distance)
+        distance.byteswap()
+    parts.append(distance.tobytes())
+    
+    temp_path = f"{path}.tmp{os.getpid()}"
+    with open(temp_path, "wb") as f:
+        f.write(b"".join(parts))
+    os.replace(temp_path, path)
+
+def read_maze_file(path, width, height, seed, compact):
+    """캐시 파일 읽기 (헤더가 맞지 않으면 None)"""
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return _parse_maze_buffer(buffer, width, height, seed, compact)
+
+def _parse_maze_buffer(buffer, width, height, seed, compact):
+    """캐시 파일 내용 해석 (반환값은 buffer를 참조하지 않음)"""
+    if len(buffer) < _HEADER.size:
+        return None
+    magic, version, flags, file_width, file_height, file_seed, item_count, merchant_count, room_count = \
+        _HEADER.unpack_from(buffer, 0)
+    if (magic != _MAGIC or version != CACHE_FORMAT_VERSION or file_width != width or
+            file_height != height or file_seed != seed or bool(flags & _FLAG_COMPACT) != compact):
+        return None
+    
+    grid_offset = _HEADER.size
+    records_offset = grid_offset + ((width * height + 7) >> 3)
+    distance_offset = (records_offset + item_count * _ITEM_RECORD.size +
+                       (merchant_count + room_count) * _POS_RECORD.size)
+    distance = array(distance_typecode(width * height))
+    expected_size = distance_offset + width * height * distance.itemsize
+    if len(buffer) != expected_size:
+        return None
+    
+    cells = unpack_grid(buffer[grid_offset:records_offset], width * height)
+    
+    item_records = list(_ITEM_RECORD.iter_unpack(buffer[records_offset:records_offset + item_count * _ITEM_RECORD.size]))
+    offset = records_offset + item_count * _ITEM_RECORD.size
+    merchant_records = list(_POS_RECORD.iter_unpack(buffer[offset:offset + merchant_count * _POS_RECORD.size]))
+    offset += merchant_count * _POS_RECORD.size
+    room_records = list(_POS_RECORD.iter_unpack(buffer[offset:offset + room_count * _POS_RECORD.size]))
+    
+    distance.frombytes(buffer[distance_offset:expected_size])
+    if sys.byteorder == "big":
+        distance.byteswap()
+    
+    return CachedMaze(cells, item_records, merchant_records, room_records, distance)
+
+class MazeCache:
+    """(seed, 크기, 생성 알고리즘/버전, 배치 설정) 키 기반 미로 디스크 캐시"""
+    def __init__(self, directory=config.MAZE_CACHE_DIR):
+        self.directory = directory
+    
+    def path_for(self, seed, width, height, generator, compact):
+        """캐시 파일 경로"""
+        mode = "compact" if compact else "list"
+        name = (f"{generator}-v{config.MAZE_GENERATOR_VERSION}-p{placement_fingerprint()}-"
+                f"{mode}-{width}x{height}-{seed}.maze")
+        return os.path.join(self.directory, name)
+    
+    def load(self, maze, seed):
+        """미로에 해당하는 캐시 읽기 (없거나 손상되면 None)"""
+        path = self.path_for(seed, maze.width, maze.height, maze.generator, maze.compact)
+        if not os.path.exists(path):
+            return None
+        try:
+            return read_maze_file(path, maze.width, maze.height, seed, maze.compact)
+        except (OSError, ValueError, struct.error) as e:
+            print(f"미로 캐시 로드 실패 {path}: {e}")
+            return None
+    
+    def store(self, maze, seed):
+        """생성된 미로 저장"""
+        path = self.path_for(seed, maze.width, maze.height, maze.generator, maze.compact)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            write_maze_file(path, maze, seed)
+        except OSError as e:
+            print(f"미로 캐시 저장 실패 {path}: {e}")
@@ -2,107 +2,167 @@
 상점 및 룰렛 시스템
 """
 
+import math
 import random
 from game.core import config
 from game.systems import effects
 
+# 룰렛 슬롯 정의 (효과 종류, 기본 weight)
+ROULETTE_SLOT_DEFINITIONS = (
+    ("speed_up", 2.0),
+    ("vision_up", 2.0),
+    ("hunger_rate_down", 2.0),
+    ("hunger_instant_up", 2.0),
+    ("food_boost", 1.5),
+    ("speed_down", 1.5),
+    ("vision_down", 1.5),
+    ("double_reward", 1.0),
+)
+
+# 효과 종류 → Effect 클래스 매핑
+EFFECT_CLASSES = {
+    "speed_up": effects.SpeedUp,
+    "speed_down": effects.SpeedDown,
+    "vision_up": effects.VisionUp,
+    "vision_down": effects.VisionDown,
+    "hunger_rate_down": effects.HungerRateDown,
+    "hunger_instant_up": effects.HungerInstantUp,
+    "food_boost": effects.FoodBoost,
+    "double_reward": effects.DoubleReward,
+}
+
 class RouletteSlot:
-    """룰렛 슬롯"""
+    """룰렛 슬롯 (RouletteTable이 공유하므로 변경하지 않음)"""
+    __slots__ = ("effect_type", "weight", "effect_class")
+    
     def __init__(self, effect_type, weight):
         self.effect_type = effect_type
         self.weight = weight
-        self.effect_class = None  # Effect 클래스는 나중에 설정
+        self.effect_class = EFFECT_CLASSES.get(effect_type)
+
+def _weight_factor(effect_type, trade_number):
+    """trade_number번째 거래에서 곱해지는 weight 배율"""
+    if effect_type in effects.GOOD_EFFECTS:
+        # 좋은 효과: weight 감소
+        return max(config.ROULETTE_WEIGHT_MIN, 1 - trade_number * config.ROULETTE_WEIGHT_DECAY_RATE)
+    if effect_type in effects.BAD_EFFECTS:
+        # 나쁜 효과: weight 증가
+        return 1 + trade_number * config.ROULETTE_WEIGHT_INCREASE_RATE
+    return 1.0
+
+def build_alias_table(probabilities):
+    """Vose 별칭 테이블 (prob, alias) 생성 - 확률 합은 1"""
+    count = len(probabilities)
+    prob = [0.0] * count
+    alias = list(range(count))
+    scaled = [p * count for p in probabilities]
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    
+    while small and large:
+        s = small.pop()
+        l = large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] = scaled[l] + scaled[s] - 1.0
+        (small if scaled[l] < 1.0 else large).append(l)
+    
+    # 남은 칸은 부동소수 오차만 있으므로 확률 1
+    for i in small + large:
+        prob[i] = 1.0
+    return tuple(prob), tuple(alias)
+
+class RouletteTable:
+    """모든 상인이 공유하는 불변 룰렛 테이블 (거래 횟수별 확률/별칭 테이블 캐시)"""
+    def __init__(self, slot_definitions):
+        self.slots = tuple(RouletteSlot(effect_type, weight) for effect_type, weight in slot_definitions)
+        self._log_multipliers = [tuple(0.0 for _ in self.slots)]  # 거래 횟수별 누적 log 배율
+        self._tables = {}  # 거래 횟수 -> (확률, prob, alias)
+    
+    def _log_multiplier(self, traded_times):
+        """1~traded_times번째 거래 배율의 누적 곱 (log, 오버플로 방지)"""
+        logs = self._log_multipliers
+        while len(logs) <= traded_times:
+            trade_number = len(logs)
+            logs.append(tuple(log + math.log(_weight_factor(slot.effect_type, trade_number))
+                              for log, slot in zip(logs[-1], self.slots)))
+        return logs[traded_times]
+    
+    def _get_table(self, traded_times):
+        """거래 횟수별 (확률, prob, alias) - 처음 요청 시 한 번만 계산"""
+        table = self._tables.get(traded_times)
+        if table is None:
+            logs = self._log_multiplier(traded_times)
+            top = max(math.log(slot.weight) + log for slot, log in zip(self.slots, logs))
+            weights = [slot.weight * math.exp(log - top) for slot, log in zip(self.slots, logs)]
+            total = sum(weights)
+            probabilities = tuple(w / total for w in weights)
+            table = (probabilities, *build_alias_table(probabilities))
+            self._tables[traded_times] = table
+        return table
+    
+    def probabilities(self, traded_times):
+        """거래 횟수별 슬롯 확률"""
+        return self._get_table(traded_times)[0]
+    
+    def alias_table(self, traded_times):
+        """거래 횟수별 별칭 테이블 (prob, alias)"""
+        return self._get_table(traded_times)[1:]
+    
+    def sample(self, rng, traded_times):
+        """별칭 방법으로 슬롯 하나 선택 (난수 1회, O(1))"""
+        prob, alias = self.alias_table(traded_times)
+        u = rng.random() * len(prob)
+        i = int(u)
+        return self.slots[i] if u - i < prob[i] else self.slots[alias[i]]
+
+def roulette_slot_definitions():
+    """룰렛 슬롯 정의 (최소 8칸)"""
+    slots = list(ROULETTE_SLOT_DEFINITIONS)
+    
+    # 최소 8칸 보장
+    while len(slots) < config.ROULETTE_SLOTS_MIN:
+        # 추가 슬롯 (좋은 효과와 나쁜 효과 균형)
+        if len(slots) % 2 == 0:
+            slots.append(("speed_up", 1.0))
+        else:
+            slots.append(("speed_down", 1.0))
+    return slots
+
+# 공유 룰렛 테이블
+ROULETTE_TABLE = RouletteTable(roulette_slot_definitions())
 
 class Merchant:
     """상인 클래스"""
-    def __init__(self, x, y):
+    __slots__ = ("x", "y", "rng", "sprite_key", "traded_times")
+    
+    def __init__(self, x, y, rng=None):
         self.x = x
         self.y = y
+        self.rng = rng if rng is not None else random.Random()  # 룰렛/안전 거래 난수 스트림
         self.sprite_key = "merchant"
         self.traded_times = 0
-        self.roulette_slots = []
-        self._initialize_roulette()
-    
-    def _initialize_roulette(self):
-        """룰렛 초기화 (최소 8칸)"""
-        # 룰렛 슬롯 정의
-        slots = [
-            ("speed_up", 2.0),
-            ("vision_up", 2.0),
-            ("hunger_rate_down", 2.0),
-            ("hunger_instant_up", 2.0),
-            ("food_boost", 1.5),
-            ("speed_down", 1.5),
-            ("vision_down", 1.5),
-            ("double_reward", 1.0),
-        ]
-        
-        # 최소 8칸 보장
-        while len(slots) < config.ROULETTE_SLOTS_MIN:
-            # 추가 슬롯 (좋은 효과와 나쁜 효과 균형)
-            if len(slots) % 2 == 0:
-                slots.append(("speed_up", 1.0))
-            else:
-                slots.append(("speed_down", 1.0))
-        
-        self.roulette_slots = [RouletteSlot(effect_type, weight) for effect_type, weight in slots]
-        
-        # Effect 클래스 매핑
-        effect_classes = {
-            "speed_up": effects.SpeedUp,
-            "speed_down": effects.SpeedDown,
-            "vision_up": effects.VisionUp,
-            "vision_down": effects.VisionDown,
-            "hunger_rate_down": effects.HungerRateDown,
-            "hunger_instant_up": effects.HungerInstantUp,
-            "food_boost": effects.FoodBoost,
-            "double_reward": effects.DoubleReward,
-        }
-        
-        for slot in self.roulette_slots:
-            if slot.effect_type in effect_classes:
-                slot.effect_class = effect_classes[slot.effect_type]
-    
-    def adjust_roulette_weights(self):
-        """거래 횟수에 따른 룰렛 weight 조정"""
-        for slot in self.roulette_slots:
-            if slot.effect_type in effects.GOOD_EFFECTS:
-                # 좋은 효과: weight 감소
-                slot.weight *= max(
-                    config.ROULETTE_WEIGHT_MIN,
-                    1 - self.traded_times * config.ROULETTE_WEIGHT_DECAY_RATE
-                )
-            elif slot.effect_type in effects.BAD_EFFECTS:
-                # 나쁜 효과: weight 증가
-                slot.weight *= (1 + self.traded_times * config.ROULETTE_WEIGHT_INCREASE_RATE)
+    
+    @property
+    def roulette_slots(self):
+        """룰렛 슬롯 (공유 테이블)"""
+        return ROULETTE_TABLE.slots
+    
+    def roulette_probabilities(self):
+        """현재 거래 횟수 기준 슬롯 확률"""
+        return ROULETTE_TABLE.probabilities(self.traded_times)
     
     def spin_roulette(self):
-        """룰렛 돌리기"""
-        # weight 조정
-        self.adjust_roulette_weights()
-        
-        # weight 기반 확률 계산
-        total_weight = sum(slot.weight for slot in self.roulette_slots)
-        r = random.uniform(0, total_weight)
-        
-        current_weight = 0
-        selected_slot = None
-        for slot in self.roulette_slots:
-            current_weight += slot.weight
-            if r <= current_weight:
-                selected_slot = slot
-                break
-        
-        if selected_slot and selected_slot.effect_class:
+        """룰렛 돌리기 (거래 횟수에 따라 좋은 효과는 줄고 나쁜 효과는 늘어남)"""
+        slot = ROULETTE_TABLE.sample(self.rng, self.traded_times)
+        if slot.effect_class:
             # Effect 인스턴스 생성
-            effect = selected_slot.effect_class()
-            return effect
-        
+            return slot.effect_class()
         return None
     
     def safe_trade(self):
         """안전 거래"""
-        r = random.random()
+        r = self.rng.random()
         
         if r < config.SAFE_TRADE_FOOD_CHANCE:
             # Food 아이템 (여기서는 HungerInstantUp으로 대체)
@@ -4,6 +4,7 @@ Player 클래스 및 GameStats
 
 from game.core import config
 from game.systems import effects
+from game.systems import timers
 
 class GameStats:
     """게임 통계"""
@@ -20,12 +21,16 @@ class GameStats:
         self.died_by_hunger = False
         self.random_seed = None
         self.hunger_90plus_time = 0.0
+        self.shortest_path_length = None  # 시작점→출구 최단 거리 (타일)
+        self.tiles_walked = 0  # 실제 이동한 타일 수
 
 class Player:
     """플레이어 클래스"""
     def __init__(self, x, y, stats, resources=None):
         self.x = x
         self.y = y
+        self.prev_x = x  # 직전 틱 위치 (렌더링 보간용)
+        self.prev_y = y
         self.stats = stats
         self.resources = resources
         
@@ -54,10 +59,15 @@ class Player:
         self.vision_radius = config.BASE_VISION_RADIUS
         
         # 효과
-        self.effects = []
+        self.effects = []  # 활성 효과 (같은 효과는 중첩 수로 합침)
         self.has_food_boost = False
         self.has_double_reward = False
         self.has_invincible_on_max_hunger = False
+        self.timers = timers.Scheduler()  # 효과 만료 예약
+        self._effect_stacks = {}  # stack_key -> 효과
+        self._conditional_effects = []
+        self._modifiers_dirty = False
+        self._greed_level = (False, 0)  # 현재 반영된 욕심 디버프 단계
         
         # 상태
         self.sprite_key = "player"
@@ -95,14 +105,17 @@ class Player:
         # 배고픔 증가
         self.update_hunger(dt)
         
-        # 효과 갱신
-        self.effects = [e for e in self.effects if e.update(self, dt)]
+        # 효과 만료 처리 (만료 시각이 된 예약만 실행)
+        self.timers.advance(dt)
         
-        # 효과 재적용 (효과가 만료되면 제거)
-        self._reapply_effects()
+        # 조건부 효과 확인
+        for effect in tuple(self._conditional_effects):
+            if not effect.is_satisfied(self):
+                self._remove_effect(effect)
         
-        # 욕심 디버프 적용
-        self._apply_greed_debuff()
+        # 효과가 바뀌었거나 욕심 단계가 바뀐 경우에만 능력치 재계산
+        if self._modifiers_dirty or self._get_greed_level() != self._greed_level:
+            self._recompute_modifiers()
         
         # 배고픔 사망 체크
         if self.hunger <= 0:
@@ -114,8 +127,10 @@ class Player:
         hunger_decrease = self.hunger_rate * self.hunger_rate_multiplier * dt
         self.hunger = max(0, self.hunger - hunger_decrease)
     
-    def _reapply_effects(self):
-        """효과 재적용 (속도/시야 등)"""
+    def _recompute_modifiers(self):
+        """효과와 욕심 디버프로 속도/시야/배고픔 배율 재계산"""
+        self._modifiers_dirty = False
+        
         # 속도/시야 배율 초기화
         self.speed_multiplier = 1.0
         self.vision_radius = self.base_vision_radius
@@ -124,10 +139,24 @@ class Player:
         self.has_double_reward = False
         self.has_invincible_on_max_hunger = False
         
-        # 모든 활성 효과 재적용
+        # 모든 활성 효과 재적용 (중첩 수만큼)
         for effect in self.effects:
-            if effect.active:
+            for _ in range(effect.stacks):
                 effect.apply(self)
+        
+        # 욕심 디버프 적용
+        self._greed_level = self._get_greed_level()
+        self._apply_greed_debuff()
+    
+    def _get_greed_level(self):
+        """황금알 개수에 따른 욕심 디버프 단계 (시야 감소 여부, 속도 감소 단계)"""
+        if self.eggs >= config.EGG_SPEED_THRESHOLD2:
+            speed_level = 2
+        elif self.eggs >= config.EGG_SPEED_THRESHOLD1:
+            speed_level = 1
+        else:
+            speed_level = 0
+        return (self.eggs >= config.EGG_VISION_THRESHOLD, speed_level)
     
     def _apply_greed_debuff(self):
         """욕심 디버프 적용"""
@@ -143,10 +172,50 @@ class Player:
             self.speed_multiplier *= (1 - config.EGG_SPEED_REDUCTION1)
     
     def apply_effect(self, effect):
-        """효과 적용"""
-        effect.apply(self)
-        self.effects.append(effect)
-        self._reapply_effects()
+        """효과 적용 (즉시 효과는 한 번만 적용하고 보관하지 않음)"""
+        if effect.is_instant():
+            effect.apply(self)
+            effect.expire(self)
+            return
+        
+        # 같은 효과가 이미 있으면 중첩 수만 증가
+        stacked = self._effect_stacks.get(effect.stack_key)
+        if stacked is None:
+            stacked = effect
+            self._effect_stacks[effect.stack_key] = effect
+            self.effects.append(effect)
+            if effect.conditional:
+                self._conditional_effects.append(effect)
+        else:
+            stacked.stacks += 1
+        
+        if effect.duration > 0:
+            timer = self.timers.schedule(effect.duration, lambda: self._remove_stack(stacked))
+            stacked.expiry_times.append(timer.due)
+        
+        self._recompute_modifiers()
+    
+    def _remove_stack(self, effect):
+        """만료된 중첩 하나 제거 (마지막 중첩이면 효과 제거)"""
+        if not effect.active:
+            return
+        if effect.expiry_times:
+            del effect.expiry_times[0]
+        effect.stacks -= 1
+        self._modifiers_dirty = True
+        if effect.stacks <= 0:
+            self._remove_effect(effect)
+    
+    def _remove_effect(self, effect):
+        """효과 전체 제거"""
+        effect.expire(self)
+        effect.stacks = 0
+        effect.expiry_times.clear()
+        self.effects.remove(effect)
+        del self._effect_stacks[effect.stack_key]
+        if effect.conditional:
+            self._conditional_effects.remove(effect)
+        self._modifiers_dirty = True
     
     def get_tile_pos(self):
         """타일 좌표 반환"""
@@ -155,4 +224,14 @@ class Player:
     def get_pixel_pos(self):
         """픽셀 좌표 반환"""
         return (self.x, self.y)
+    
+    def save_previous_position(self):
+        """틱 시작 시 위치 저장"""
+        self.prev_x = self.x
+        self.prev_y = self.y
+    
+    def get_render_pos(self, alpha):
+        """직전 틱과 현재 틱 사이 보간 위치 (alpha: 0~1)"""
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha)
 
@@ -0,0 +1,68 @@
+"""
+공간 인덱스 - 타일 좌표 버킷 해시 (상인/비밀 방 근접 검색)
+"""
+
+from game.core import config
+
+class SpatialHash:
+    """타일 좌표를 고정 크기 버킷으로 묶는 공간 인덱스"""
+    def __init__(self, cell_size=config.SPATIAL_CELL_TILES):
+        self.cell_size = cell_size
+        self.buckets = {}  # (bucket_x, bucket_y) -> [(순서, tile_x, tile_y, obj)]
+        self._count = 0
+    
+    def _bucket_key(self, tile_x, tile_y):
+        """타일 좌표 → 버킷 키"""
+        return (tile_x // self.cell_size, tile_y // self.cell_size)
+    
+    def insert(self, tile_x, tile_y, obj):
+        """객체 등록"""
+        entry = (self._count, tile_x, tile_y, obj)
+        self.buckets.setdefault(self._bucket_key(tile_x, tile_y), []).append(entry)
+        self._count += 1
+    
+    def remove(self, tile_x, tile_y, obj):
+        """객체 제거"""
+        key = self._bucket_key(tile_x, tile_y)
+        bucket = self.buckets.get(key)
+        if not bucket:
+            return
+        bucket[:] = [entry for entry in bucket if entry[3] is not obj]
+        if not bucket:
+            del self.buckets[key]
+    
+    def get_at(self, tile_x, tile_y):
+        """정확히 해당 타일에 있는 객체 (먼저 등록된 것 우선)"""
+        for _, entry_x, entry_y, obj in self.buckets.get(self._bucket_key(tile_x, tile_y), ()):
+            if entry_x == tile_x and entry_y == tile_y:
+                return obj
+        return None
+    
+    def query_radius(self, tile_x, tile_y, radius):
+        """반경(가로/세로 각각) 안의 객체 (먼저 등록된 것 우선, 인접 버킷만 검사)"""
+        best = None
+        bucket_x0, bucket_y0 = self._bucket_key(tile_x - radius, tile_y - radius)
+        bucket_x1, bucket_y1 = self._bucket_key(tile_x + radius, tile_y + radius)
+        
+        for bucket_y in range(bucket_y0, bucket_y1 + 1):
+            for bucket_x in range(bucket_x0, bucket_x1 + 1):
+                for entry in self.buckets.get((bucket_x, bucket_y), ()):
+                    order, entry_x, entry_y, _ = entry
+                    if abs(entry_x - tile_x) <= radius and abs(entry_y - tile_y) <= radius:
+                        if best is None or order < best[0]:
+                            best = entry
+        
+        return best[3] if best else None
+    
+    def query_rect(self, tile_x0, tile_y0, tile_x1, tile_y1):
+        """사각형 범위 (양 끝 포함) 안의 객체 목록 (겹치는 버킷만 검사)"""
+        found = []
+        bucket_x0, bucket_y0 = self._bucket_key(tile_x0, tile_y0)
+        bucket_x1, bucket_y1 = self._bucket_key(tile_x1, tile_y1)
+        
+        for bucket_y in range(bucket_y0, bucket_y1 + 1):
+            for bucket_x in range(bucket_x0, bucket_x1 + 1):
+                for _, entry_x, entry_y, obj in self.buckets.get((bucket_x, bucket_y), ()):
+                    if tile_x0 <= entry_x <= tile_x1 and tile_y0 <= entry_y <= tile_y1:
+                        found.append(obj)
+        return found
@@ -0,0 +1,67 @@
+"""
+타이머 스케줄러 - 만료 시각 최소 힙으로 예약 콜백 실행
+"""
+
+import heapq
+import itertools
+
+class Timer:
+    """예약된 콜백 하나 (Scheduler.schedule이 반환)"""
+    __slots__ = ("due", "callback", "cancelled")
+    
+    def __init__(self, due, callback):
+        self.due = due
+        self.callback = callback
+        self.cancelled = False
+
+class Scheduler:
+    """씬/플레이어 단위 타이머 모음 (틱마다 만료된 항목만 꺼냄)"""
+    def __init__(self):
+        self.now = 0.0
+        self._heap = []  # (만료 시각, 순번, Timer)
+        self._seq = itertools.count()
+    
+    def schedule(self, delay, callback):
+        """delay초 뒤에 callback 호출 예약"""
+        timer = Timer(self.now + delay, callback)
+        heapq.heappush(self._heap, (timer.due, next(self._seq), timer))
+        return timer
+    
+    def cancel(self, timer):
+        """예약 취소 (힙에서는 꺼낼 때 버림)"""
+        if timer is not None:
+            timer.cancelled = True
+    
+    def remaining(self, timer):
+        """남은 시간 (취소/만료된 타이머는 0)"""
+        if timer is None or timer.cancelled:
+            return 0.0
+        return max(0.0, timer.due - self.now)
+    
+    def is_pending(self, timer):
+        """아직 실행되지 않은 타이머인지 확인"""
+        return timer is not None and not timer.cancelled and timer.due > self.now
+    
+    def advance(self, dt):
+        """시간을 dt만큼 진행하고 만료된 콜백을 시각 순서대로 실행"""
+        target = self.now + dt
+        heap = self._heap
+        while heap and heap[0][0] <= target:
+            due, _, timer = heapq.heappop(heap)
+            if timer.cancelled:
+                continue
+            # 콜백 안에서 새로 예약하면 원래 만료 시각 기준으로 잡힘
+            self.now = max(self.now, due)
+            timer.cancelled = True
+            timer.callback()
+        self.now = target
+    
+    def fast_forward(self):
+        """다음 예약 시각으로 바로 건너뛰고 실행 (대기할 예약이 없으면 None)"""
+        heap = self._heap
+        while heap and heap[0][2].cancelled:
+            heapq.heappop(heap)
+        if not heap:
+            return None
+        self.advance(max(0.0, heap[0][0] - self.now))
+        return self.now
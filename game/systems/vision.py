@@ -0,0 +1,103 @@
+"""
+시야 시스템 - 시야 원판 오프셋 사전 계산 및 시야선(섀도캐스팅) 캐시
+"""
+
+from game.core import config
+
+# 반경별 원판 오프셋 캐시
+_disc_offsets_cache = {}
+
+# 옥탄트 좌표 변환 계수 (xx, xy, yx, yy)
+_OCTANTS = [
+    (1, 0, 0, 1), (0, 1, 1, 0), (0, -1, 1, 0), (-1, 0, 0, 1),
+    (-1, 0, 0, -1), (0, -1, -1, 0), (0, 1, -1, 0), (1, 0, 0, -1),
+]
+
+def disc_offsets(radius):
+    """반경 내 타일 오프셋 목록 (반경별 1회만 계산)"""
+    offsets = _disc_offsets_cache.get(radius)
+    if offsets is None:
+        radius_sq = radius * radius
+        offsets = tuple(
+            (dx, dy)
+            for dy in range(-radius, radius + 1)
+            for dx in range(-radius, radius + 1)
+            if dx * dx + dy * dy <= radius_sq
+        )
+        _disc_offsets_cache[radius] = offsets
+    return offsets
+
+def compute_line_of_sight(is_opaque, origin_x, origin_y, radius):
+    """재귀 섀도캐스팅으로 보이는 타일 집합 계산"""
+    visible = {(origin_x, origin_y)}
+    for xx, xy, yx, yy in _OCTANTS:
+        _cast_light(is_opaque, visible, origin_x, origin_y, radius, 1, 1.0, 0.0, xx, xy, yx, yy)
+    return visible
+
+def _cast_light(is_opaque, visible, origin_x, origin_y, radius, row, start, end, xx, xy, yx, yy):
+    """옥탄트 하나에 대한 빛 투사"""
+    if start < end:
+        return
+    
+    radius_sq = radius * radius
+    new_start = 0.0
+    for j in range(row, radius + 1):
+        dx, dy = -j - 1, -j
+        blocked = False
+        while dx <= 0:
+            dx += 1
+            x = origin_x + dx * xx + dy * xy
+            y = origin_y + dx * yx + dy * yy
+            left_slope = (dx - 0.5) / (dy + 0.5)
+            right_slope = (dx + 0.5) / (dy - 0.5)
+            if start < right_slope:
+                continue
+            if end > left_slope:
+                break
+            
+            if dx * dx + dy * dy <= radius_sq:
+                visible.add((x, y))
+            
+            if blocked:
+                # 벽 구간 진행 중
+                if is_opaque(x, y):
+                    new_start = right_slope
+                    continue
+                blocked = False
+                start = new_start
+            elif is_opaque(x, y) and j < radius:
+                # 벽을 만나면 남은 구간을 재귀로 처리
+                blocked = True
+                _cast_light(is_opaque, visible, origin_x, origin_y, radius, j + 1, start, left_slope,
+                            xx, xy, yx, yy)
+                new_start = right_slope
+        if blocked:
+            break
+
+class VisionField:
+    """플레이어 시야 타일 캐시 (타일 이동 또는 반경 변경 시에만 재계산)"""
+    def __init__(self, maze, line_of_sight=config.VISION_LINE_OF_SIGHT):
+        self.maze = maze
+        self.line_of_sight = line_of_sight
+        self.visible_tiles = ()
+        self._key = None
+    
+    def update(self, tile_x, tile_y, radius):
+        """현재 시야 타일 반환 (캐시 키가 같으면 그대로 재사용)"""
+        key = (tile_x, tile_y, radius)
+        if key == self._key:
+            return self.visible_tiles
+        self._key = key
+        
+        if self.line_of_sight:
+            tiles = compute_line_of_sight(self._is_opaque, tile_x, tile_y, radius)
+        else:
+            tiles = ((tile_x + dx, tile_y + dy) for dx, dy in disc_offsets(radius))
+        
+        in_bounds = self.maze.in_bounds
+        self.visible_tiles = tuple((x, y) for x, y in tiles if in_bounds(x, y))
+        return self.visible_tiles
+    
+    def _is_opaque(self, tile_x, tile_y):
+        """시야를 가리는 타일인지 확인"""
+        return not self.maze.is_walkable(tile_x, tile_y)
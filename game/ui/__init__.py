@@ -3,3 +3,7 @@ UI 모듈
 """
 
 from game.ui.ui import UI
+from game.ui.maze_layer import MazeLayer, StreamingMazeLayer
+from game.ui.fog_layer import FogLayer
+from game.ui.minimap import Minimap
+from game.ui.roulette_wheel import RouletteWheel
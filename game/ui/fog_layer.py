@@ -0,0 +1,62 @@
+"""
+FogLayer - 탐험 기록 기반 전장의 안개 (타일 해상도 알파 마스크)
+"""
+
+import pygame
+from game.core import config
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class FogLayer:
+    """타일당 1픽셀 알파 마스크를 화면 범위만 확대해 한 번에 덮는 레이어"""
+    def __init__(self, maze):
+        self.maze = maze
+        # 미탐험 타일은 불투명, 탐험한 타일은 반투명
+        self.mask = pygame.Surface((maze.width, maze.height), pygame.SRCALPHA)
+        self.mask.fill((*config.FOG_COLOR, 255))
+        self.version = 0
+        self.overlay = None
+        self._overlay_key = None
+    
+    def reveal(self, tiles):
+        """새로 탐험한 타일의 마스크 알파 갱신"""
+        if not tiles:
+            return
+        if numpy is not None:
+            xs = numpy.fromiter((x for x, _ in tiles), dtype=numpy.intp, count=len(tiles))
+            ys = numpy.fromiter((y for _, y in tiles), dtype=numpy.intp, count=len(tiles))
+            alpha = pygame.surfarray.pixels_alpha(self.mask)
+            alpha[xs, ys] = config.FOG_EXPLORED_ALPHA
+            del alpha  # 픽셀 잠금 해제
+        else:
+            color = (*config.FOG_COLOR, config.FOG_EXPLORED_ALPHA)
+            for x, y in tiles:
+                self.mask.fill(color, (x, y, 1, 1))
+        self.version += 1
+    
+    def _visible_tile_rect(self, camera):
+        """카메라와 겹치는 타일 범위 (미로 범위로 잘라냄)"""
+        left, top, right, bottom = camera.get_view_bounds()
+        x0 = max(0, int(left // config.TILE_SIZE))
+        y0 = max(0, int(top // config.TILE_SIZE))
+        x1 = min(self.maze.width, int(right // config.TILE_SIZE) + 1)
+        y1 = min(self.maze.height, int(bottom // config.TILE_SIZE) + 1)
+        return pygame.Rect(x0, y0, max(0, x1 - x0), max(0, y1 - y0))
+    
+    def render(self, screen, camera):
+        """안개 오버레이 blit (마스크나 타일 범위가 바뀔 때만 다시 확대)"""
+        rect = self._visible_tile_rect(camera)
+        if rect.width == 0 or rect.height == 0:
+            return
+        
+        key = (tuple(rect), self.version)
+        if key != self._overlay_key:
+            self._overlay_key = key
+            self.overlay = pygame.transform.scale(
+                self.mask.subsurface(rect),
+                (rect.width * config.TILE_SIZE, rect.height * config.TILE_SIZE))
+        
+        screen.blit(self.overlay, camera.apply((rect.x * config.TILE_SIZE, rect.y * config.TILE_SIZE)))
@@ -0,0 +1,157 @@
+"""
+MazeLayer - 정적 미로 타일 레이어 (청크 단위 사전 렌더링)
+"""
+
+import pygame
+from collections import OrderedDict
+from game.core import config
+
+class MazeLayer:
+    """벽/바닥 타일을 청크 Surface로 한 번만 그려 두는 레이어"""
+    def __init__(self, maze, resources, chunk_tiles=config.MAZE_CHUNK_TILES):
+        self.maze = maze
+        self.resources = resources
+        self.chunk_tiles = chunk_tiles
+        self.chunk_pixels = chunk_tiles * config.TILE_SIZE
+        self.cols = (maze.width + chunk_tiles - 1) // chunk_tiles
+        self.rows = (maze.height + chunk_tiles - 1) // chunk_tiles
+        self.chunks = {}
+        self.build()
+    
+    def build(self):
+        """모든 청크 렌더링 (미로 생성 직후 1회)"""
+        self.chunks = {}
+        for cy in range(self.rows):
+            for cx in range(self.cols):
+                self.chunks[(cx, cy)] = self._render_chunk(cx, cy)
+    
+    def _render_chunk(self, cx, cy):
+        """청크 하나를 Surface로 렌더링"""
+        x0 = cx * self.chunk_tiles
+        y0 = cy * self.chunk_tiles
+        x1 = min(x0 + self.chunk_tiles, self.maze.width)
+        y1 = min(y0 + self.chunk_tiles, self.maze.height)
+        rows = [self.maze.grid[y][x0:x1] for y in range(y0, y1)]
+        return self._render_tiles(rows, x1 - x0, y1 - y0)
+    
+    def _render_tiles(self, rows, width, height):
+        """타일 행 목록을 Surface 하나로 렌더링"""
+        atlas = self.resources.get_atlas()
+        wall_area = self.resources.get_sprite_rect("wall")
+        floor_area = self.resources.get_sprite_rect("floor")
+        
+        surface = pygame.Surface((width * config.TILE_SIZE, height * config.TILE_SIZE)).convert()
+        
+        blit_list = []
+        for local_y, row in enumerate(rows):
+            for local_x in range(width):
+                area = wall_area if row[local_x] == 0 else floor_area
+                blit_list.append((atlas, (local_x * config.TILE_SIZE, local_y * config.TILE_SIZE), area))
+        surface.blits(blit_list, doreturn=False)
+        return surface
+    
+    def _get_chunk_surface(self, cx, cy):
+        """청크 Surface 가져오기 (범위 밖이면 None)"""
+        return self.chunks.get((cx, cy))
+    
+    def _visible_chunk_range(self, camera):
+        """카메라와 겹치는 청크 범위 (cx0, cy0, cx1, cy1)"""
+        left, top, right, bottom = camera.get_view_bounds()
+        return (max(0, int(left // self.chunk_pixels)),
+                max(0, int(top // self.chunk_pixels)),
+                min(self.cols - 1, int(right // self.chunk_pixels)),
+                min(self.rows - 1, int(bottom // self.chunk_pixels)))
+    
+    def render(self, screen, camera):
+        """카메라와 겹치는 청크만 한 번에 blit"""
+        cx0, cy0, cx1, cy1 = self._visible_chunk_range(camera)
+        blit_list = []
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                chunk = self._get_chunk_surface(cx, cy)
+                if chunk is not None:
+                    blit_list.append((chunk, camera.apply((cx * self.chunk_pixels, cy * self.chunk_pixels))))
+        screen.blits(blit_list, doreturn=False)
+    
+    def render_tiles(self, screen, camera, tiles):
+        """타일 목록을 청크 Surface에서 잘라 한 번에 blit"""
+        tile_size = config.TILE_SIZE
+        chunk_tiles = self.chunk_tiles
+        offset_x, offset_y = camera.apply((0, 0))
+        chunk_surfaces = {}  # 이번 호출에서 찾은 청크 Surface (None 포함)
+        
+        blit_list = []
+        for tile_x, tile_y in tiles:
+            cx, local_x = divmod(tile_x, chunk_tiles)
+            cy, local_y = divmod(tile_y, chunk_tiles)
+            key = (cx, cy)
+            if key in chunk_surfaces:
+                chunk = chunk_surfaces[key]
+            else:
+                chunk = chunk_surfaces[key] = self._get_chunk_surface(cx, cy)
+            if chunk is None:
+                continue
+            blit_list.append((chunk, (tile_x * tile_size + offset_x, tile_y * tile_size + offset_y),
+                              (local_x * tile_size, local_y * tile_size, tile_size, tile_size)))
+        screen.blits(blit_list, doreturn=False)
+
+class StreamingMazeLayer(MazeLayer):
+    """무한 미로용 레이어 (청크 Surface를 필요할 때 그리고 LRU로 버림)"""
+    def __init__(self, maze, resources, max_chunks=config.ENDLESS_MAX_CHUNK_SURFACES):
+        self.maze = maze
+        self.resources = resources
+        self.chunk_tiles = maze.chunk_tiles
+        self.chunk_pixels = self.chunk_tiles * config.TILE_SIZE
+        self.max_chunks = max_chunks
+        self.chunks = OrderedDict()
+    
+    def _render_chunk(self, cx, cy):
+        """미로 청크 하나를 Surface로 렌더링 (청크가 아직 생성되지 않았으면 None)"""
+        chunk = self.maze.get_loaded_chunk(cx, cy)
+        if chunk is None:
+            return None
+        cells = chunk.cells
+        size = self.chunk_tiles
+        rows = [cells[y * size:(y + 1) * size] for y in range(size)]
+        return self._render_tiles(rows, size, size)
+    
+    def _get_chunk_surface(self, cx, cy):
+        """청크 Surface 가져오기 (prefetch가 아직 그리지 않았으면 None, 빈칸으로 표시)"""
+        chunk = self.chunks.get((cx, cy))
+        if chunk is not None:
+            self.chunks.move_to_end((cx, cy))
+        return chunk
+    
+    def _store_chunk(self, cx, cy):
+        """청크 렌더링 후 캐시 (초과 시 가장 오래된 Surface 제거)"""
+        chunk = self._render_chunk(cx, cy)
+        if chunk is None:
+            return None
+        self.chunks[(cx, cy)] = chunk
+        while len(self.chunks) > self.max_chunks:
+            self.chunks.popitem(last=False)
+        return chunk
+    
+    def _visible_chunk_range(self, camera):
+        """카메라와 겹치는 청크 범위 (오른쪽/아래 경계 없음)"""
+        left, top, right, bottom = camera.get_view_bounds()
+        return (max(0, int(left // self.chunk_pixels)),
+                max(0, int(top // self.chunk_pixels)),
+                int(right // self.chunk_pixels),
+                int(bottom // self.chunk_pixels))
+    
+    def prefetch(self, camera, budget=config.ENDLESS_CHUNKS_PER_FRAME):
+        """화면 주변 한 청크 여유분까지 화면 중심에 가까운 순으로 미리 렌더링 (프레임당 budget개)"""
+        cx0, cy0, cx1, cy1 = self._visible_chunk_range(camera)
+        center_x2 = cx0 + cx1
+        center_y2 = cy0 + cy1
+        
+        missing = []
+        for cy in range(max(0, cy0 - 1), cy1 + 2):
+            for cx in range(max(0, cx0 - 1), cx1 + 2):
+                if (cx, cy) not in self.chunks and self.maze.get_loaded_chunk(cx, cy) is not None:
+                    missing.append((abs(cx * 2 - center_x2) + abs(cy * 2 - center_y2), cx, cy))
+        
+        missing.sort()
+        for _, cx, cy in missing[:budget]:
+            self._store_chunk(cx, cy)
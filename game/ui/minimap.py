@@ -0,0 +1,49 @@
+"""
+Minimap - 탐험한 타일만 덧그리는 축소 지도
+"""
+
+import pygame
+from game.core import config
+
+class Minimap:
+    """미로 전체를 타일당 몇 픽셀로 축소한 Surface (새로 탐험한 타일만 갱신)"""
+    def __init__(self, maze, size=config.MINIMAP_SIZE):
+        self.maze = maze
+        self.size = size
+        # 작은 미로는 크게, 큰 미로는 타일당 1픽셀 (화면에는 플레이어 주변만 잘라 표시)
+        self.tile_pixels = max(1, min(config.MINIMAP_MAX_TILE_PIXELS, size // max(maze.width, maze.height)))
+        self.surface = pygame.Surface((maze.width * self.tile_pixels, maze.height * self.tile_pixels)).convert()
+        self.surface.fill(config.MINIMAP_UNEXPLORED_COLOR)
+        self.view_width = min(size, self.surface.get_width())
+        self.view_height = min(size, self.surface.get_height())
+    
+    def reveal(self, tiles):
+        """새로 탐험한 타일 픽셀만 칠하기 (상인은 발견 시 함께 표시)"""
+        tp = self.tile_pixels
+        grid = self.maze.grid
+        merchant_index = self.maze.merchant_index
+        for x, y in tiles:
+            if merchant_index.get_at(x, y) is not None:
+                color = config.MINIMAP_MERCHANT_COLOR
+            elif grid[y][x] == 1:
+                color = config.MINIMAP_FLOOR_COLOR
+            else:
+                color = config.MINIMAP_WALL_COLOR
+            self.surface.fill(color, (x * tp, y * tp, tp, tp))
+    
+    def render(self, screen, x, y, player_tile):
+        """플레이어 중심으로 잘라낸 영역과 플레이어 위치 표시"""
+        tp = self.tile_pixels
+        px = player_tile[0] * tp
+        py = player_tile[1] * tp
+        
+        # 표시 영역 (지도 밖으로 나가지 않게 고정)
+        left = min(max(0, px - self.view_width // 2), self.surface.get_width() - self.view_width)
+        top = min(max(0, py - self.view_height // 2), self.surface.get_height() - self.view_height)
+        
+        pygame.draw.rect(screen, (200, 200, 200), (x - 1, y - 1, self.view_width + 2, self.view_height + 2), 1)
+        screen.blit(self.surface, (x, y), (left, top, self.view_width, self.view_height))
+        
+        dot = max(2, tp)
+        screen.fill(config.MINIMAP_PLAYER_COLOR,
+                    (x + px - left + (tp - dot) // 2, y + py - top + (tp - dot) // 2, dot, dot))
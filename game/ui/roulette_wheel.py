@@ -0,0 +1,78 @@
+"""
+RouletteWheel - 슬롯 배치별로 한 번 그린 룰렛 원판과 회전 프레임 캐시
+"""
+
+import math
+import pygame
+from game.core import config
+
+# 초록색으로 표시하는 효과 (나머지는 빨강)
+GOOD_SLOT_TYPES = ("speed_up", "vision_up", "hunger_rate_down",
+                   "hunger_instant_up", "food_boost", "double_reward")
+
+class RouletteWheel:
+    """룰렛 원판 + 화살표 (회전은 양자화 각도별 transform.rotate 결과를 재사용)"""
+    def __init__(self, slot_types, radius=config.ROULETTE_WHEEL_RADIUS, step=config.ROULETTE_ROTATION_STEP):
+        self.slot_types = slot_types
+        self.radius = radius
+        self.frame_count = max(1, round(360 / step))
+        self.frames = {}  # 양자화 각도 인덱스 -> 회전된 Surface
+        self.base = self._draw_base()
+        self.frames[0] = self.base
+    
+    def _draw_base(self):
+        """회전 0도 원판 그리기 (화살표는 원판 아래쪽 90도 위치)"""
+        radius = self.radius
+        half = radius + 32  # 화살표까지 들어가는 여유
+        surface = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA).convert_alpha()
+        surface.fill((0, 0, 0, 0))
+        
+        angle_per_slot = 360 / len(self.slot_types)
+        arc_steps = max(2, int(angle_per_slot))
+        for i, effect_type in enumerate(self.slot_types):
+            color = (0, 200, 0) if effect_type in GOOD_SLOT_TYPES else (200, 0, 0)
+            start_angle = i * angle_per_slot
+            
+            # 호 그리기 (한 번만 그리므로 1도 간격)
+            points = [(half, half)]
+            for k in range(arc_steps + 1):
+                rad = math.radians(start_angle + angle_per_slot * k / arc_steps)
+                points.append((half + radius * math.cos(rad), half + radius * math.sin(rad)))
+            pygame.draw.polygon(surface, color, points)
+            pygame.draw.polygon(surface, (255, 255, 255), points, 2)
+        
+        # 화살표 (원판과 함께 회전)
+        arrow_x = half
+        arrow_y = half + radius + 20
+        pygame.draw.polygon(surface, (255, 255, 0), [
+            (arrow_x, arrow_y - 10),
+            (arrow_x + 15, arrow_y),
+            (arrow_x, arrow_y + 10)
+        ])
+        return surface
+    
+    def get_frame(self, rotation):
+        """rotation도(시계 방향)에 가장 가까운 캐시 프레임 (없으면 한 번만 회전)"""
+        index = round(rotation * self.frame_count / 360) % self.frame_count
+        frame = self.frames.get(index)
+        if frame is None:
+            # transform.rotate는 반시계 방향
+            frame = pygame.transform.rotate(self.base, -index * 360 / self.frame_count)
+            self.frames[index] = frame
+        return frame
+    
+    def render(self, screen, center, rotation):
+        """원판 중심을 center에 맞춰 한 번에 blit"""
+        frame = self.get_frame(rotation)
+        screen.blit(frame, frame.get_rect(center=center))
+
+_wheels = {}  # 슬롯 배치 -> RouletteWheel
+
+def get_wheel(roulette_slots):
+    """슬롯 배치가 같으면 같은 원판 재사용 (상인들은 룰렛 테이블을 공유)"""
+    slot_types = tuple(slot.effect_type for slot in roulette_slots)
+    wheel = _wheels.get(slot_types)
+    if wheel is None:
+        wheel = RouletteWheel(slot_types)
+        _wheels[slot_types] = wheel
+    return wheel
@@ -20,6 +20,7 @@ class Game:
         
         self.clock = pygame.time.Clock()
         self.running = True
+        self.accumulator = 0.0  # 아직 시뮬레이션하지 않은 시간
         
         # ResourceManager 초기화
         self.resources = resources.ResourceManager()
@@ -40,17 +41,22 @@ class Game:
     
     def run(self):
         """메인 게임 루프"""
+        step = 1.0 / config.SIMULATION_TICK_RATE
         while self.running:
-            dt = self.clock.tick(60) / 1000.0  # 초 단위
+            frame_time = self.clock.tick(self._frame_cap()) / 1000.0  # 초 단위
             
             # 이벤트 처리
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     self.running = False
+                elif event.type == pygame.VIDEOEXPOSE:
+                    # 창이 가려졌다 드러나면 전체를 다시 그림
+                    self.current_scene.mark_dirty()
                 elif event.type == pygame.KEYDOWN:
                     # 디버그 키
                     if event.key == pygame.K_F1:
                         self.debug_mode = not self.debug_mode
+                        self.current_scene.mark_dirty()
                     elif event.key == pygame.K_F2:
                         if hasattr(self.stats, 'random_seed') and self.stats.random_seed:
                             print(f"랜덤 시드: {self.stats.random_seed}")
@@ -59,26 +65,70 @@ class Game:
                 self.current_scene.handle_event(event)
             
             # 씬 업데이트
-            self.current_scene.update(dt)
+            if config.FIXED_TIMESTEP:
+                alpha = self._run_fixed_steps(frame_time, step)
+            else:
+                self.current_scene.update(frame_time)
+                alpha = 1.0
             
-            # 씬 렌더링
-            self.current_scene.render(self.screen)
+            # 정적 씬은 바뀐 것이 없으면 그리지도 화면에 반영하지도 않음
+            if self._is_idle():
+                continue
+            
+            # 씬 렌더링 (직전 틱과 현재 틱 사이 보간)
+            self.current_scene.render(self.screen, alpha)
             
             # 디버그 정보
             if self.debug_mode:
                 self._render_debug()
             
-            pygame.display.flip()
+            self._present()
         
         pygame.quit()
         sys.exit()
     
+    def _run_fixed_steps(self, frame_time, step):
+        """누적 시간만큼 고정 간격으로 씬 업데이트 후 보간 비율 반환"""
+        self.accumulator += frame_time * config.SIMULATION_SPEED
+        
+        steps = 0
+        while self.accumulator >= step and steps < config.MAX_CATCHUP_STEPS:
+            self.current_scene.update(step)
+            self.accumulator -= step
+            steps += 1
+        
+        # 따라잡지 못한 시간은 버려서 지연이 계속 쌓이지 않게 함
+        if self.accumulator >= step:
+            self.accumulator %= step
+        
+        return self.accumulator / step
+    
+    def _is_idle(self):
+        """정적 씬이 다시 그릴 필요 없는 상태인지 확인"""
+        scene = self.current_scene
+        return (config.DIRTY_RECT_RENDERING and scene.static
+                and not scene.needs_redraw and not self.debug_mode)
+    
+    def _frame_cap(self):
+        """이번 프레임 제한 (정적 씬이 멈춰 있으면 낮춰서 CPU 사용 최소화)"""
+        if self._is_idle():
+            return config.IDLE_FPS_CAP
+        return config.FPS_CAP
+    
+    def _present(self):
+        """바뀐 영역만 화면에 반영 (영역을 모르면 전체 flip)"""
+        rects = self.current_scene.take_dirty_rects()
+        if rects is None or self.debug_mode or not config.DIRTY_RECT_RENDERING:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
+    
     def _render_debug(self):
         """디버그 정보 렌더링"""
-        font = pygame.font.Font(None, 24)
         debug_texts = [
             f"FPS: {int(self.clock.get_fps())}",
             f"씬: {type(self.current_scene).__name__}",
+            f"텍스트 캐시: {self.resources.text_cache_hits} 적중 / {self.resources.text_cache_misses} 실패",
         ]
         
         if hasattr(self.current_scene, 'game_player'):
@@ -90,6 +140,8 @@ class Game:
                 f"시야: {player.vision_radius}",
             ])
         
+        # 매 프레임 바뀌는 값이라 텍스트 캐시를 거치지 않음 (적중률 통계와 LRU 오염 방지)
+        font = self.resources.get_font("debug")
         y = 10
         for text in debug_texts:
             surface = font.render(text, True, (255, 255, 0))
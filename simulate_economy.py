@@ -0,0 +1,216 @@
+"""
+황금알을 낳는 거위: 환생 - 상인 거래 몬테카를로 시뮬레이터 (룰렛 weight 튜닝용)
+
+거래 예산(거래 횟수)별로 좋은/나쁜 효과 개수 분포를 출력한다.
+numpy가 있으면 시행 전체를 배열로 한 번에 진행하고, 없으면 같은 모델을 파이썬 루프로 돌린다.
+
+사용법:
+    python simulate_economy.py --trials 1000000 --trades 20
+    python simulate_economy.py --trials 1000000 --trades 20 --roulette-share 0.7 --decay 0.05 --increase 0.15
+    python simulate_economy.py --trials 1000000 --trades 20 --histogram histogram.csv
+"""
+
+import argparse
+import csv
+import os
+import random
+import sys
+
+# game 패키지가 pygame을 불러오면서 표준 출력에 찍는 안내 문구가 CSV 앞에 섞이지 않게 함
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from game.core import config
+from game.systems import effects
+from game.systems import merchant
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+SUMMARY_FIELDS = ["trades", "mean_good", "p_good_0", "p_good_ge_3", "max_good",
+                  "mean_bad", "p_bad_0", "p_bad_le_1", "p_bad_ge_3", "max_bad"]
+HISTOGRAM_FIELDS = ["trades", "kind", "count", "trials", "probability"]
+
+def safe_trade_outcomes():
+    """안전 거래 결과 (효과 종류, 확률) - Merchant.safe_trade와 같은 순서"""
+    food = config.SAFE_TRADE_FOOD_CHANCE
+    hunger_rate_down = config.SAFE_TRADE_HUNGER_RATE_DOWN_CHANCE
+    speed_up = config.SAFE_TRADE_SPEED_UP_CHANCE
+    return [
+        ("hunger_instant_up", food),
+        ("hunger_rate_down", hunger_rate_down),
+        ("speed_up", speed_up),
+        ("hunger_instant_up", max(0.0, 1.0 - food - hunger_rate_down - speed_up)),
+    ]
+
+class EconomyResult:
+    """시뮬레이션 누적 결과"""
+    def __init__(self, trials, trades):
+        self.trials = trials
+        self.trades = trades
+        self.good_histogram = [[0] * (trades + 1) for _ in range(trades + 1)]  # [예산][좋은 효과 수]
+        self.bad_histogram = [[0] * (trades + 1) for _ in range(trades + 1)]  # [예산][나쁜 효과 수]
+        self.effect_counts = {}  # 효과 종류 -> 전체 횟수
+    
+    def add_effect_counts(self, effect_types, counts):
+        for effect_type, count in zip(effect_types, counts):
+            if count:
+                self.effect_counts[effect_type] = self.effect_counts.get(effect_type, 0) + int(count)
+    
+    def add_histogram(self, histogram_row, counts):
+        for k, count in enumerate(counts):
+            if count:
+                histogram_row[k] += int(count)
+    
+    def summary_rows(self):
+        """예산별 요약 행"""
+        rows = []
+        for t in range(1, self.trades + 1):
+            good = self.good_histogram[t]
+            bad = self.bad_histogram[t]
+            rows.append((t,
+                         round(_histogram_total(good) / self.trials, 4),
+                         round(good[0] / self.trials, 4),
+                         round(sum(good[3:]) / self.trials, 4),
+                         _histogram_max(good),
+                         round(_histogram_total(bad) / self.trials, 4),
+                         round(bad[0] / self.trials, 4),
+                         round(sum(bad[:2]) / self.trials, 4),
+                         round(sum(bad[3:]) / self.trials, 4),
+                         _histogram_max(bad)))
+        return rows
+    
+    def histogram_rows(self):
+        """(예산, 좋은/나쁜, 효과 수)별 시행 수 행 (0인 칸은 생략)"""
+        rows = []
+        for t in range(1, self.trades + 1):
+            for kind, histogram in (("good", self.good_histogram[t]), ("bad", self.bad_histogram[t])):
+                for k, count in enumerate(histogram):
+                    if count:
+                        rows.append((t, kind, k, count, round(count / self.trials, 6)))
+        return rows
+
+def _histogram_total(histogram):
+    """히스토그램의 효과 수 총합"""
+    return sum(k * count for k, count in enumerate(histogram))
+
+def _histogram_max(histogram):
+    """시행 중 나온 최대 효과 수"""
+    return max((k for k, count in enumerate(histogram) if count), default=0)
+
+def simulate_numpy(table, trials, trades, roulette_share, seed, batch_size):
+    """배열 연산으로 시행 묶음을 한꺼번에 진행"""
+    rng = numpy.random.default_rng(seed)
+    result = EconomyResult(trials, trades)
+    slot_types = [slot.effect_type for slot in table.slots]
+    slot_good = numpy.array([t in effects.GOOD_EFFECTS for t in slot_types])
+    slot_bad = numpy.array([t in effects.BAD_EFFECTS for t in slot_types])
+    safe_types = [t for t, _ in safe_trade_outcomes()]
+    safe_good = numpy.array([t in effects.GOOD_EFFECTS for t in safe_types])
+    safe_cumulative = numpy.cumsum([p for _, p in safe_trade_outcomes()])
+    alias_tables = [None] + [tuple(numpy.array(a) for a in table.alias_table(t)) for t in range(1, trades + 1)]
+    slot_count = len(slot_types)
+    
+    for start in range(0, trials, batch_size):
+        n = min(batch_size, trials - start)
+        good = numpy.zeros(n, dtype=numpy.int32)
+        bad = numpy.zeros(n, dtype=numpy.int32)
+        for t in range(1, trades + 1):
+            is_roulette = rng.random(n) < roulette_share
+            
+            # 룰렛: 별칭 테이블 샘플링 (trade_roulette가 traded_times를 먼저 올림)
+            prob, alias = alias_tables[t]
+            u = rng.random(n) * slot_count
+            index = u.astype(numpy.intp)
+            picked = numpy.where(u - index < prob[index], index, alias[index])
+            
+            # 안전 거래: 누적 확률 구간 선택
+            safe_pick = numpy.minimum(numpy.searchsorted(safe_cumulative, rng.random(n), side="right"),
+                                      len(safe_types) - 1)
+            
+            good += numpy.where(is_roulette, slot_good[picked], safe_good[safe_pick])
+            bad += is_roulette & slot_bad[picked]
+            
+            result.add_histogram(result.good_histogram[t], numpy.bincount(good, minlength=trades + 1))
+            result.add_histogram(result.bad_histogram[t], numpy.bincount(bad, minlength=trades + 1))
+            result.add_effect_counts(slot_types, numpy.bincount(picked[is_roulette], minlength=slot_count))
+            result.add_effect_counts(safe_types, numpy.bincount(safe_pick[~is_roulette], minlength=len(safe_types)))
+    return result
+
+def simulate_python(table, trials, trades, roulette_share, seed):
+    """numpy가 없을 때 같은 모델을 시행마다 진행"""
+    rng = random.Random(seed)
+    result = EconomyResult(trials, trades)
+    outcomes = safe_trade_outcomes()
+    
+    for _ in range(trials):
+        good = bad = 0
+        for t in range(1, trades + 1):
+            if rng.random() < roulette_share:
+                effect_type = table.sample(rng, t).effect_type
+                bad += effect_type in effects.BAD_EFFECTS
+            else:
+                r = rng.random()
+                effect_type = outcomes[-1][0]
+                for candidate, chance in outcomes:
+                    if r < chance:
+                        effect_type = candidate
+                        break
+                    r -= chance
+            good += effect_type in effects.GOOD_EFFECTS
+            result.effect_counts[effect_type] = result.effect_counts.get(effect_type, 0) + 1
+            result.good_histogram[t][good] += 1
+            result.bad_histogram[t][bad] += 1
+    return result
+
+def write_csv(path, fields, rows):
+    """CSV 쓰기 (path가 - 이면 표준 출력)"""
+    out = sys.stdout if path == "-" else open(path, "w", newline="", encoding="utf-8")
+    try:
+        writer = csv.writer(out)
+        writer.writerow(fields)
+        writer.writerows(rows)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="상인 거래 몬테카를로 시뮬레이터")
+    parser.add_argument("--trials", type=int, default=100000, help="거래 시퀀스 수")
+    parser.add_argument("--trades", type=int, default=20, help="시퀀스당 최대 거래 횟수 (한 상인)")
+    parser.add_argument("--roulette-share", type=float, default=1.0, help="거래 중 룰렛 비율 (나머지는 안전 거래)")
+    parser.add_argument("--decay", type=float, default=config.ROULETTE_WEIGHT_DECAY_RATE,
+                        help="ROULETTE_WEIGHT_DECAY_RATE")
+    parser.add_argument("--increase", type=float, default=config.ROULETTE_WEIGHT_INCREASE_RATE,
+                        help="ROULETTE_WEIGHT_INCREASE_RATE")
+    parser.add_argument("--min-weight", type=float, default=config.ROULETTE_WEIGHT_MIN, help="ROULETTE_WEIGHT_MIN")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--batch-size", type=int, default=1000000, help="numpy 모드 한 번에 진행할 시행 수")
+    parser.add_argument("--summary", default="-", help="요약 CSV 경로 (기본: 표준 출력)")
+    parser.add_argument("--histogram", help="예산·효과 수별 분포 CSV 경로 (- 이면 표준 출력)")
+    args = parser.parse_args()
+    
+    # 튜닝 값으로 새 룰렛 테이블 구성
+    config.ROULETTE_WEIGHT_DECAY_RATE = args.decay
+    config.ROULETTE_WEIGHT_INCREASE_RATE = args.increase
+    config.ROULETTE_WEIGHT_MIN = args.min_weight
+    table = merchant.RouletteTable(merchant.roulette_slot_definitions())
+    
+    if numpy is not None:
+        result = simulate_numpy(table, args.trials, args.trades, args.roulette_share, args.seed, args.batch_size)
+    else:
+        print("numpy가 없어 파이썬 루프로 실행합니다 (느림)", file=sys.stderr)
+        result = simulate_python(table, args.trials, args.trades, args.roulette_share, args.seed)
+    
+    write_csv(args.summary, SUMMARY_FIELDS, result.summary_rows())
+    if args.histogram:
+        write_csv(args.histogram, HISTOGRAM_FIELDS, result.histogram_rows())
+    
+    # 전체 효과 분포
+    total = sum(result.effect_counts.values())
+    for effect_type, count in sorted(result.effect_counts.items(), key=lambda kv: -kv[1]):
+        print(f"{effect_type:<20}{count / total:>8.2%}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()